@@ -1,7 +1,7 @@
 """
 Assignment Problem Example
 
-Assign workers to tasks minimizing total cost (via flow reduction).
+Assign workers to tasks minimizing total cost.
 """
 
 from solvor import solve_assignment
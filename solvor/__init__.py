@@ -3,7 +3,14 @@
 __version__ = "0.5.4"
 
 from solvor.a_star import astar, astar_grid
-from solvor.anneal import anneal, exponential_cooling, linear_cooling, logarithmic_cooling
+from solvor.anneal import (
+    anneal,
+    exponential_cooling,
+    linear_cooling,
+    logarithmic_cooling,
+    lundy_mees_cooling,
+    reciprocal_cooling,
+)
 from solvor.articulation import articulation_points, bridges
 from solvor.bayesian import bayesian_opt
 from solvor.bellman_ford import bellman_ford
@@ -52,6 +59,8 @@ __all__ = [
     "exponential_cooling",
     "linear_cooling",
     "logarithmic_cooling",
+    "lundy_mees_cooling",
+    "reciprocal_cooling",
     "solve_sat",
     "Model",
     "bayesian_opt",
@@ -29,6 +29,12 @@ Parameters:
     neighbors: function returning a random neighbor
     temperature: starting temperature (default: 1000)
     cooling: cooling schedule or rate (default: 0.9995)
+    landscape_modified: clip objective at the running best in the acceptance test,
+        tolerates faster cooling such as reciprocal_cooling (default: False)
+    patience: stop after this many iterations without a new best, 0 = off (default: 0)
+    batch: neighbors drawn per iteration, the best one faces the acceptance test (default: 1)
+    n_restarts: independent chains to run, best one wins (default: 1)
+    n_workers: worker processes for the chains, None runs them in sequence
 
 The neighbor function is key: good neighbors make small moves, not random jumps.
 Think "swap two cities" for TSP, not "shuffle everything".
@@ -38,19 +44,33 @@ Cooling schedules:
     exponential_cooling(rate)  : temp = initial * rate^iter (default, classic)
     linear_cooling(min_temp)   : temp decreases linearly to min_temp
     logarithmic_cooling(c)     : temp = initial / (1 + c * log(1 + iter))
+    lundy_mees_cooling(beta)   : temp = temp / (1 + beta * temp), fast when hot, slow when cold
+    reciprocal_cooling(alpha)  : temp = initial / (1 + alpha * iter^2)
+
+Each schedule runs until max_iter or until temp drops below min_temp, so pick
+min_temp with the schedule's tail in mind (reciprocal and Lundy-Mees approach
+zero polynomially, not exponentially).
 
 Don't use this for: problems needing guarantees, or constraints easier to encode
 in MILP/CP. Consider tabu (memory) or genetic (population) for more control.
 """
 
 from collections.abc import Callable
-from math import exp, log
+from math import log
 from random import Random
 
 from solvor.types import ProgressCallback, Result, Status
-from solvor.utils.helpers import Evaluator, report_progress
-
-__all__ = ["anneal", "exponential_cooling", "linear_cooling", "logarithmic_cooling"]
+from solvor.utils.helpers import report_progress
+from solvor.utils.parallel import multistart
+
+__all__ = [
+    "anneal",
+    "exponential_cooling",
+    "linear_cooling",
+    "logarithmic_cooling",
+    "lundy_mees_cooling",
+    "reciprocal_cooling",
+]
 
 CoolingSchedule = Callable[[float, int, int], float]
 
@@ -82,6 +102,25 @@ def logarithmic_cooling(c: float = 1.0) -> CoolingSchedule:
     return schedule
 
 
+def lundy_mees_cooling(beta: float = 1e-3) -> CoolingSchedule:
+    """Lundy-Mees cooling: temp = temp / (1 + beta * temp), one step per iteration."""
+
+    # Closed form of the recurrence: 1/temp_k = 1/initial + k * beta
+    def schedule(initial_temp: float, iteration: int, max_iter: int) -> float:
+        return initial_temp / (1 + beta * iteration * initial_temp)
+
+    return schedule
+
+
+def reciprocal_cooling(alpha: float = 1e-6) -> CoolingSchedule:
+    """Reciprocal (quadratic) cooling: temp = initial / (1 + alpha * iteration^2)."""
+
+    def schedule(initial_temp: float, iteration: int, max_iter: int) -> float:
+        return initial_temp / (1 + alpha * iteration * iteration)
+
+    return schedule
+
+
 def anneal[T](
     initial: T,
     objective_fn: Callable[[T], float],
@@ -93,43 +132,108 @@ def anneal[T](
     min_temp: float = 1e-8,
     max_iter: int = 100_000,
     seed: int | None = None,
+    landscape_modified: bool = False,
+    patience: int = 0,
+    batch: int = 1,
+    n_restarts: int = 1,
+    n_workers: int | None = None,
     on_progress: ProgressCallback | None = None,
     progress_interval: int = 0,
 ) -> Result:
     """Simulated annealing with configurable cooling schedule."""
+    if batch < 1:
+        raise ValueError(f"batch must be at least 1, got {batch}")
+
+    if n_restarts > 1:
+        seeder = Random(seed)
+        return multistart(
+            anneal,
+            initial,
+            objective_fn,
+            neighbors,
+            runs=[{"seed": seeder.getrandbits(63)} for _ in range(n_restarts)],
+            minimize=minimize,
+            n_workers=n_workers,
+            temperature=temperature,
+            cooling=cooling,
+            min_temp=min_temp,
+            max_iter=max_iter,
+            landscape_modified=landscape_modified,
+            patience=patience,
+            batch=batch,
+            on_progress=on_progress,
+            progress_interval=progress_interval,
+        )
+
     rng = Random(seed)
-    evaluate = Evaluator(objective_fn, minimize)
+    rand = rng.random
+    ln = log
+    sign = 1 if minimize else -1
 
-    if callable(cooling):
-        schedule = cooling
+    # Minimizing calls objective_fn directly, maximizing negates in one thin wrapper
+    if minimize:
+        evaluate = objective_fn
     else:
-        schedule = exponential_cooling(cooling)
+
+        def evaluate(sol):
+            return -objective_fn(sol)
+
+    # Plain float rate cools geometrically, one multiply per step instead of a pow
+    rate = None if callable(cooling) else cooling
+    schedule = cooling if callable(cooling) else exponential_cooling(cooling)
 
     solution, obj = initial, evaluate(initial)
+    evals = 1
     best_solution, best_obj = solution, obj
+    best_iter = 0
     initial_temp = temperature
+    # Progress bookkeeping only runs on reporting iterations, not every step
+    report_every = progress_interval if on_progress is not None and progress_interval > 0 else 0
 
     for iteration in range(1, max_iter + 1):
-        temperature = schedule(initial_temp, iteration, max_iter)
+        if rate is None:
+            temperature = schedule(initial_temp, iteration, max_iter)
+        else:
+            temperature *= rate
 
         if temperature < min_temp:
             break
 
-        neighbor = neighbors(solution)
-        neighbor_obj = evaluate(neighbor)
-        delta = neighbor_obj - obj
-
-        if delta < 0 or rng.random() < exp(-delta / temperature):
+        if batch == 1:
+            neighbor = neighbors(solution)
+            neighbor_obj = evaluate(neighbor)
+        else:
+            # Best of several candidates, one temperature step and one acceptance draw
+            candidates = [neighbors(solution) for _ in range(batch)]
+            objs = list(map(evaluate, candidates))
+            k = objs.index(min(objs))
+            neighbor, neighbor_obj = candidates[k], objs[k]
+        evals += batch
+        if landscape_modified:
+            # Clip the landscape at the running best: moves that stay below it are free
+            delta = max(neighbor_obj, best_obj) - max(obj, best_obj)
+        else:
+            delta = neighbor_obj - obj
+
+        # Metropolis test u < exp(-delta/T) rewritten as delta < -T*log(u), u in (0, 1].
+        # u is at least 2^-53, so -log(u) < 37 and moves more than 37 temperatures uphill
+        # are rejected without drawing
+        if delta < 0 or (delta < 37.0 * temperature and delta < -temperature * ln(1.0 - rand())):
             solution, obj = neighbor, neighbor_obj
 
             if obj < best_obj:
                 best_solution, best_obj = solution, obj
+                best_iter = iteration
+
+        if patience and iteration - best_iter >= patience:
+            break
 
-        if report_progress(
-            on_progress, progress_interval, iteration, evaluate.to_user(obj), evaluate.to_user(best_obj), evaluate.evals
+        if (
+            report_every
+            and iteration % report_every == 0
+            and report_progress(on_progress, report_every, iteration, sign * obj, sign * best_obj, evals)
         ):
-            return Result(best_solution, evaluate.to_user(best_obj), iteration, evaluate.evals, Status.FEASIBLE)
+            return Result(best_solution, sign * best_obj, iteration, evals, Status.FEASIBLE)
 
-    final_obj = evaluate.to_user(best_obj)
     status = Status.MAX_ITER if iteration == max_iter else Status.FEASIBLE
-    return Result(best_solution, final_obj, iteration, evaluate.evals, status)
+    return Result(best_solution, sign * best_obj, iteration, evals, status)
@@ -13,7 +13,9 @@ proven in 1973. Good enough for most real-world packing.
 
 How it works: process items one by one (optionally sorted by size descending),
 placing each in an existing bin if it fits or opening a new bin. Best-fit
-minimizes wasted space per bin, first-fit is faster.
+minimizes wasted space per bin, first-fit is faster. Both run in O(n log n):
+best-fit bisects a sorted list of remaining capacities, first-fit descends a
+max segment tree over bins in opening order.
 
 Use this for:
 
@@ -33,6 +35,7 @@ Available algorithms: 'first-fit', 'best-fit', 'first-fit-decreasing',
 better results. For optimal solutions on small instances, use MILP instead.
 """
 
+from bisect import bisect_left, insort
 from collections.abc import Sequence
 
 from solvor.types import Result, Status
@@ -78,55 +81,84 @@ def solve_bin_pack(
     else:
         indices = list(range(n))
 
-    # Bins: list of (remaining_capacity, [item_indices])
-    bins: list[tuple[float, list[int]]] = []
-    assignments = [0] * n  # assignments[item] = bin_index
+    if use_best_fit:
+        assignments, num_bins = _best_fit(item_sizes, indices, bin_capacity)
+    else:
+        assignments, num_bins = _first_fit(item_sizes, indices, bin_capacity)
+
+    # Status: we can't prove optimality with heuristics
+    status = Status.FEASIBLE if num_bins > 1 else Status.OPTIMAL
+
+    return Result(tuple(assignments), float(num_bins), 0, n, status)
+
+
+def _best_fit(item_sizes, indices, bin_capacity):
+    # Open bins kept sorted as (remaining, bin), bisect finds the tightest fit in O(log B)
+    open_bins = []
+    assignments = [0] * len(item_sizes)
+    num_bins = 0
 
     for item_idx in indices:
         size = item_sizes[item_idx]
 
         if size == 0:
             # Zero-size items go in first bin (or create one)
-            if not bins:
-                bins.append((bin_capacity, []))
-            bins[0][1].append(item_idx)
-            assignments[item_idx] = 0
+            if num_bins == 0:
+                open_bins.append((bin_capacity, 0))
+                num_bins = 1
             continue
 
-        best_bin = -1
-
-        if use_best_fit:
-            # Find bin with least remaining space that still fits
-            best_remaining = float("inf")
-            for b, (remaining, _) in enumerate(bins):
-                if size <= remaining < best_remaining:
-                    best_remaining = remaining
-                    best_bin = b
+        # (size, -1) sorts before every (size, bin), ties go to the lowest bin index
+        k = bisect_left(open_bins, (size, -1))
+        if k == len(open_bins):
+            remaining, b = bin_capacity, num_bins
+            num_bins += 1
         else:
-            # First-fit: find first bin that fits
-            for b, (remaining, _) in enumerate(bins):
-                if size <= remaining:
-                    best_bin = b
-                    break
-
-        if best_bin == -1:
-            # Open new bin
-            best_bin = len(bins)
-            bins.append((bin_capacity, []))
-
-        # Place item in bin
-        remaining, items = bins[best_bin]
-        items.append(item_idx)
-        bins[best_bin] = (remaining - size, items)
-        assignments[item_idx] = best_bin
-
-    # Build result: tuple of bin assignments (item i -> bin index)
-    num_bins = len(bins)
+            remaining, b = open_bins.pop(k)
 
-    # Status: we can't prove optimality with heuristics
-    status = Status.FEASIBLE if num_bins > 1 else Status.OPTIMAL
+        # A full bin can't take any positive item, drop it from the search
+        if remaining > size:
+            insort(open_bins, (remaining - size, b))
+        assignments[item_idx] = b
 
-    return Result(tuple(assignments), float(num_bins), 0, n, status)
+    return assignments, num_bins
+
+
+def _first_fit(item_sizes, indices, bin_capacity):
+    # Max segment tree over bins in opening order. Unopened bins sit at full capacity,
+    # so the leftmost leaf that fits is the first-fit choice, opening a new bin if needed.
+    leaves = 1
+    while leaves < len(item_sizes):
+        leaves *= 2
+    tree = [bin_capacity] * (2 * leaves)
+    assignments = [0] * len(item_sizes)
+    num_bins = 0
+
+    for item_idx in indices:
+        size = item_sizes[item_idx]
+
+        if size == 0:
+            # Zero-size items go in first bin (or create one)
+            num_bins = max(num_bins, 1)
+            continue
+
+        node = 1
+        while node < leaves:
+            node *= 2
+            if tree[node] < size:
+                node += 1
+
+        b = node - leaves
+        tree[node] -= size
+        node //= 2
+        while node:
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+            node //= 2
+
+        num_bins = max(num_bins, b + 1)
+        assignments[item_idx] = b
+
+    return assignments, num_bins
 
 
 def lower_bound(item_sizes: Sequence[float], bin_capacity: float) -> int:
@@ -99,9 +99,8 @@ class IntVar:
         self.lb = lb
         self.ub = ub
         self.name = name
-        self.bool_vars = {}
-        for v in range(lb, ub + 1):
-            self.bool_vars[v] = model._new_bool_var()
+        # One bool var per domain value, consecutive so value v is _base + (v - lb)
+        self._base = model._reserve(ub - lb + 1)
 
     def __eq__(self, other):
         if isinstance(other, int):
@@ -158,10 +157,10 @@ class Model:
         self._vars = {}
         self._constraints = []
 
-    def _new_bool_var(self):
-        v = self._next_bool
-        self._next_bool += 1
-        return v
+    def _reserve(self, n):
+        base = self._next_bool
+        self._next_bool += n
+        return base
 
     def int_var(self, lb, ub, name=None):
         if name is None:
@@ -7,7 +7,7 @@ of integer variables and constraints to boolean satisfiability clauses.
 Not part of the public API - use Model from cp.py instead.
 """
 
-from itertools import combinations
+from itertools import chain, combinations
 from typing import TYPE_CHECKING, Any
 
 from solvor.sat import Status as SATStatus
@@ -20,6 +20,16 @@ if TYPE_CHECKING:
 __all__ = ["SATEncoder"]
 
 
+# At-most-one over more literals than this uses the ladder encoding instead of pairs,
+# from 8 literals on the ladder's 4k - 5 clauses undercut the k(k-1)/2 pairs
+_PAIRWISE_MAX = 7
+
+
+def _lit(var: "IntVar", val: int) -> int:
+    """Bool var for var == val, the domain's bool vars are consecutive from var._base."""
+    return var._base + (val - var.lb)
+
+
 class SATEncoder:
     """Encodes CP model to SAT and solves it."""
 
@@ -28,10 +38,11 @@ class SATEncoder:
         self._clauses: list[list[int]] = []
         self._next_bool = model._next_bool
 
-    def _new_bool_var(self) -> int:
-        v = self._next_bool
-        self._next_bool += 1
-        return v
+    def _reserve(self, n: int) -> int:
+        """Reserve n consecutive bool vars, returning the first."""
+        base = self._next_bool
+        self._next_bool += n
+        return base
 
     # Basic encoding helpers
 
@@ -40,67 +51,91 @@ class SATEncoder:
         if not lits:
             return
         self._clauses.append(lits)
-        for a, b in combinations(lits, 2):
-            self._clauses.append([-a, -b])
+        self._encode_at_most_one(lits)
 
     def _encode_at_most_one(self, lits: list[int]) -> None:
         """Encode at-most-one constraint: at most one literal can be true."""
-        for a, b in combinations(lits, 2):
-            self._clauses.append([-a, -b])
+        if len(lits) <= _PAIRWISE_MAX:
+            self._clauses.extend([-a, -b] for a, b in combinations(lits, 2))
+            return
+
+        # Ladder (sequential counter): s_i is true iff one of x_1..x_i is, and x_i may
+        # only be true while s_(i-1) is false. O(k) clauses and k - 1 aux vars instead
+        # of k(k-1)/2 pairs. The aux vars are fully determined by the x's, so solution
+        # enumeration never sees the same assignment twice.
+        k = len(lits)
+        base = self._reserve(k - 1)
+        clauses = self._clauses
+        x, s = lits[0], base
+        clauses.append([-x, s])
+        clauses.append([-s, x])
+        for i in range(1, k - 1):
+            x, prev, s = lits[i], base + i - 1, base + i
+            clauses.append([-x, s])
+            clauses.append([-prev, s])
+            clauses.append([-s, prev, x])
+            clauses.append([-x, -prev])
+        clauses.append([-lits[-1], -(base + k - 2)])
 
     # Variable encoding
 
     def _encode_vars(self) -> None:
         """Encode all integer variables as exactly-one boolean constraints."""
         for var in self.model._vars.values():
-            lits = [var.bool_vars[v] for v in range(var.lb, var.ub + 1)]
+            lits = list(range(var._base, var._base + var.ub - var.lb + 1))
             self._encode_exactly_one(lits)
 
     # Simple constraint encoding
 
     def _encode_all_different(self, variables: tuple["IntVar", ...]) -> None:
         """Encode all-different constraint: no two variables share a value."""
-        all_vals: set[int] = set()
-        for var in variables:
-            all_vals.update(range(var.lb, var.ub + 1))
+        if not variables:
+            return
 
-        for val in all_vals:
-            lits = []
-            for var in variables:
-                if val in var.bool_vars:
-                    lits.append(var.bool_vars[val])
+        # Group by value over each domain itself, gaps between far-apart domains cost nothing
+        by_value: dict[int, list[int]] = {}
+        for var in variables:
+            for val in range(var.lb, var.ub + 1):
+                by_value.setdefault(val, []).append(_lit(var, val))
+        for _, lits in sorted(by_value.items()):
             if len(lits) > 1:
                 self._encode_at_most_one(lits)
 
     def _encode_eq_const(self, var: "IntVar", val: int) -> None:
         """Encode var == constant."""
-        if val in var.bool_vars:
-            self._clauses.append([var.bool_vars[val]])
+        if var.lb <= val <= var.ub:
+            self._clauses.append([_lit(var, val)])
         else:
             self._clauses.append([])  # Unsatisfiable
 
     def _encode_ne_const(self, var: "IntVar", val: int) -> None:
         """Encode var != constant."""
-        if val in var.bool_vars:
-            self._clauses.append([-var.bool_vars[val]])
-
-    def _encode_eq_var(self, var1: "IntVar", var2: "IntVar") -> None:
-        """Encode var1 == var2."""
-        common = set(var1.bool_vars.keys()) & set(var2.bool_vars.keys())
-        for val in common:
-            self._clauses.append([-var1.bool_vars[val], var2.bool_vars[val]])
-            self._clauses.append([var1.bool_vars[val], -var2.bool_vars[val]])
-
-        for val in set(var1.bool_vars.keys()) - common:
-            self._clauses.append([-var1.bool_vars[val]])
-        for val in set(var2.bool_vars.keys()) - common:
-            self._clauses.append([-var2.bool_vars[val]])
-
-    def _encode_ne_var(self, var1: "IntVar", var2: "IntVar") -> None:
-        """Encode var1 != var2."""
-        common = set(var1.bool_vars.keys()) & set(var2.bool_vars.keys())
-        for val in common:
-            self._clauses.append([-var1.bool_vars[val], -var2.bool_vars[val]])
+        if var.lb <= val <= var.ub:
+            self._clauses.append([-_lit(var, val)])
+
+    def _encode_eq_var(self, var1: "IntVar", var2: "IntVar", offset: int = 0) -> None:
+        """Encode var1 == var2 + offset."""
+        # Matching values form one range, so literals are plain offsets from each base
+        lo, hi = max(var1.lb, var2.lb + offset), min(var1.ub, var2.ub + offset)
+        base1, base2 = var1._base - var1.lb, var2._base - var2.lb - offset
+        clauses = self._clauses
+        for val in range(lo, hi + 1):
+            clauses += ([-(base1 + val), base2 + val], [base1 + val, -(base2 + val)])
+
+        # Values without a partner are ruled out, those below lo and above hi
+        for var, base, shift in ((var1, base1, 0), (var2, base2, offset)):
+            first, last = var.lb + shift, var.ub + shift
+            if lo > hi:
+                excluded = range(first, last + 1)
+            else:
+                excluded = chain(range(first, lo), range(hi + 1, last + 1))
+            clauses.extend([-(base + val)] for val in excluded)
+
+    def _encode_ne_var(self, var1: "IntVar", var2: "IntVar", offset: int = 0) -> None:
+        """Encode var1 != var2 + offset."""
+        base1, base2 = var1._base - var1.lb, var2._base - var2.lb - offset
+        lo, hi = max(var1.lb, var2.lb + offset), min(var1.ub, var2.ub + offset)
+        self._clauses.extend([-(base1 + val), -(base2 + val)] for val in range(lo, hi + 1))
 
     # Expression handling
 
@@ -148,18 +183,9 @@ class SATEncoder:
             if isinstance(x, IntVar) and isinstance(y, IntVar):
                 right_const = right if isinstance(right, int) else 0
                 if is_ne:
-                    for v1 in x.bool_vars:
-                        v2 = v1 - right_const
-                        if v2 in y.bool_vars:
-                            self._clauses.append([-x.bool_vars[v1], -y.bool_vars[v2]])
+                    self._encode_ne_var(x, y, right_const)
                 else:
-                    for v1 in x.bool_vars:
-                        v2 = v1 - right_const
-                        if v2 in y.bool_vars:
-                            self._clauses.append([-x.bool_vars[v1], y.bool_vars[v2]])
-                            self._clauses.append([x.bool_vars[v1], -y.bool_vars[v2]])
-                        else:
-                            self._clauses.append([-x.bool_vars[v1]])
+                    self._encode_eq_var(x, y, right_const)
                 return
 
         left_terms, left_const = self._flatten_sum(left)
@@ -190,10 +216,9 @@ class SATEncoder:
             target = right_const - left_const
             if is_ne:
                 v1, v2 = left_terms
-                for val1 in v1.bool_vars:
-                    val2 = target - val1
-                    if val2 in v2.bool_vars:
-                        self._clauses.append([-v1.bool_vars[val1], -v2.bool_vars[val2]])
+                base1, base2 = v1._base - v1.lb, v2._base - v2.lb + target
+                lo, hi = max(v1.lb, target - v2.ub), min(v1.ub, target - v2.lb)
+                self._clauses.extend([-(base1 + val), -(base2 - val)] for val in range(lo, hi + 1))
             else:
                 self._encode_sum_eq(left_terms, target)
             return
@@ -204,18 +229,9 @@ class SATEncoder:
             offset = right_const - left_const
 
             if is_ne:
-                for v1 in var1.bool_vars:
-                    v2 = v1 - offset
-                    if v2 in var2.bool_vars:
-                        self._clauses.append([-var1.bool_vars[v1], -var2.bool_vars[v2]])
+                self._encode_ne_var(var1, var2, offset)
             else:
-                for v1 in var1.bool_vars:
-                    v2 = v1 - offset
-                    if v2 in var2.bool_vars:
-                        self._clauses.append([-var1.bool_vars[v1], var2.bool_vars[v2]])
-                        self._clauses.append([var1.bool_vars[v1], -var2.bool_vars[v2]])
-                    else:
-                        self._clauses.append([-var1.bool_vars[v1]])
+                self._encode_eq_var(var1, var2, offset)
 
     # Sum constraints
 
@@ -243,26 +259,57 @@ class SATEncoder:
             for val1 in range(v1.lb, v1.ub + 1):
                 val2 = target - val1
                 if val2 < v2.lb or val2 > v2.ub:
-                    self._clauses.append([-v1.bool_vars[val1]])
+                    self._clauses.append([-_lit(v1, val1)])
                 else:
-                    self._clauses.append([-v1.bool_vars[val1], v2.bool_vars[val2]])
+                    self._clauses.append([-_lit(v1, val1), _lit(v2, val2)])
             return
 
-        # n > 2: create partial sum variable and recurse
-        partial_sum = self._create_int_var(
-            variables[0].lb + variables[1].lb,
-            variables[0].ub + variables[1].ub,
-        )
-
-        for v1 in range(variables[0].lb, variables[0].ub + 1):
-            for v2 in range(variables[1].lb, variables[1].ub + 1):
-                s = v1 + v2
-                if s in partial_sum.bool_vars:
-                    self._clauses.append(
-                        [-variables[0].bool_vars[v1], -variables[1].bool_vars[v2], partial_sum.bool_vars[s]]
-                    )
+        # n > 2: sequential prefix sums. layer maps each prefix sum s of the variables
+        # so far to a literal that is true iff they sum to s. Only sums that can still
+        # reach target get a literal, the first layer reuses the first variable's own.
+        rest_lo, rest_hi = [0] * (n + 1), [0] * (n + 1)
+        for i in range(n - 1, -1, -1):
+            rest_lo[i] = rest_lo[i + 1] + variables[i].lb
+            rest_hi[i] = rest_hi[i + 1] + variables[i].ub
+
+        clauses = self._clauses
+        first = variables[0]
+        layer: dict[int, int] = {}
+        for val in range(first.lb, first.ub + 1):
+            if rest_lo[1] <= target - val <= rest_hi[1]:
+                layer[val] = _lit(first, val)
+            else:
+                clauses.append([-_lit(first, val)])
+
+        for i in range(1, n):
+            var = variables[i]
+            lo, hi = rest_lo[i + 1], rest_hi[i + 1]
+            last = i == n - 1
+            next_layer: dict[int, int] = {}
+
+            # Forward: prefix s and var == val give prefix s + val, or a dead end
+            for s, p in layer.items():
+                for val in range(var.lb, var.ub + 1):
+                    total = s + val
+                    if not lo <= target - total <= hi:
+                        clauses.append([-p, -_lit(var, val)])
+                    elif not last:
+                        q = next_layer.get(total)
+                        if q is None:
+                            q = next_layer[total] = self._reserve(1)
+                        clauses.append([-p, -_lit(var, val), q])
+
+            # Backward: a prefix sum only holds with a matching predecessor, which pins
+            # every aux literal to the variables so solutions are never repeated
+            for total, q in next_layer.items():
+                for val in range(var.lb, var.ub + 1):
+                    p = layer.get(total - val)
+                    if p is None:
+                        clauses.append([-q, -_lit(var, val)])
+                    else:
+                        clauses.append([-q, -_lit(var, val), p])
 
-        self._encode_sum_eq([partial_sum] + list(variables[2:]), target)
+            layer = next_layer
 
     def _encode_sum_le(self, variables: list["IntVar"], target: int) -> None:
         """Encode sum(variables) <= target."""
@@ -272,14 +319,14 @@ class SATEncoder:
             v = variables[0]
             for val in range(v.lb, v.ub + 1):
                 if val > target:
-                    self._clauses.append([-v.bool_vars[val]])
+                    self._clauses.append([-_lit(v, val)])
             return
         if len(variables) == 2:
             v1, v2 = variables
             for val1 in range(v1.lb, v1.ub + 1):
                 for val2 in range(v2.lb, v2.ub + 1):
                     if val1 + val2 > target:
-                        self._clauses.append([-v1.bool_vars[val1], -v2.bool_vars[val2]])
+                        self._clauses.append([-_lit(v1, val1), -_lit(v2, val2)])
             return
 
         # n > 2: create partial sum for first two, recurse
@@ -290,10 +337,10 @@ class SATEncoder:
         for val1 in range(v1.lb, v1.ub + 1):
             for val2 in range(v2.lb, v2.ub + 1):
                 s = val1 + val2
-                if s in partial_sum.bool_vars:
-                    self._clauses.append([-v1.bool_vars[val1], -v2.bool_vars[val2], partial_sum.bool_vars[s]])
+                if partial_sum.lb <= s <= partial_sum.ub:
+                    self._clauses.append([-_lit(v1, val1), -_lit(v2, val2), _lit(partial_sum, s)])
                 else:
-                    self._clauses.append([-v1.bool_vars[val1], -v2.bool_vars[val2]])
+                    self._clauses.append([-_lit(v1, val1), -_lit(v2, val2)])
 
         self._encode_sum_le([partial_sum] + list(variables[2:]), target)
 
@@ -307,14 +354,14 @@ class SATEncoder:
             v = variables[0]
             for val in range(v.lb, v.ub + 1):
                 if val < target:
-                    self._clauses.append([-v.bool_vars[val]])
+                    self._clauses.append([-_lit(v, val)])
             return
         if len(variables) == 2:
             v1, v2 = variables
             for val1 in range(v1.lb, v1.ub + 1):
                 for val2 in range(v2.lb, v2.ub + 1):
                     if val1 + val2 < target:
-                        self._clauses.append([-v1.bool_vars[val1], -v2.bool_vars[val2]])
+                        self._clauses.append([-_lit(v1, val1), -_lit(v2, val2)])
             return
 
         # n > 2: create partial sum for first two, recurse
@@ -325,10 +372,10 @@ class SATEncoder:
         for val1 in range(v1.lb, v1.ub + 1):
             for val2 in range(v2.lb, v2.ub + 1):
                 s = val1 + val2
-                if s in partial_sum.bool_vars:
-                    self._clauses.append([-v1.bool_vars[val1], -v2.bool_vars[val2], partial_sum.bool_vars[s]])
+                if partial_sum.lb <= s <= partial_sum.ub:
+                    self._clauses.append([-_lit(v1, val1), -_lit(v2, val2), _lit(partial_sum, s)])
                 else:
-                    self._clauses.append([-v1.bool_vars[val1], -v2.bool_vars[val2]])
+                    self._clauses.append([-_lit(v1, val1), -_lit(v2, val2)])
 
         self._encode_sum_ge([partial_sum] + list(variables[2:]), target)
 
@@ -338,10 +385,8 @@ class SATEncoder:
 
         name = f"_aux{self._next_bool}"
         var = IntVar(self.model, lb, ub, name)
-        # Manually create bool vars using our counter
-        var.bool_vars = {}
-        for v in range(lb, ub + 1):
-            var.bool_vars[v] = self._new_bool_var()
+        # Manually place the bool vars using our counter
+        var._base = self._reserve(ub - lb + 1)
         self.model._vars[name] = var
         return var
 
@@ -358,8 +403,8 @@ class SATEncoder:
 
         # No self-loops: x[i] != i
         for i, var in enumerate(variables):
-            if i in var.bool_vars:
-                self._clauses.append([-var.bool_vars[i]])
+            if var.lb <= i <= var.ub:
+                self._clauses.append([-_lit(var, i)])
 
         if n <= 1:
             return
@@ -367,18 +412,18 @@ class SATEncoder:
         # Subtour elimination using MTZ formulation
         t = [self._create_int_var(0 if i == 0 else 1, n - 1) for i in range(n)]
         # t[0] is fixed to 0
-        self._clauses.append([t[0].bool_vars[0]])
+        self._clauses.append([_lit(t[0], 0)])
 
         # For each edge i -> j (j != 0): t[j] >= t[i] + 1
         for i, var in enumerate(variables):
             for j in range(1, n):
-                if j in var.bool_vars:
+                if var.lb <= j <= var.ub:
                     for ti in range(var.lb, var.ub + 1):
-                        if ti not in t[i].bool_vars:
+                        if not t[i].lb <= ti <= t[i].ub:
                             continue
                         for tj in range(t[j].lb, ti + 1):
-                            if tj in t[j].bool_vars:
-                                self._clauses.append([-var.bool_vars[j], -t[i].bool_vars[ti], -t[j].bool_vars[tj]])
+                            if t[j].lb <= tj <= t[j].ub:
+                                self._clauses.append([-_lit(var, j), -_lit(t[i], ti), -_lit(t[j], tj)])
 
     def _encode_no_overlap(self, starts: tuple["IntVar", ...], durations: tuple[int, ...]) -> None:
         """Encode no-overlap constraint: intervals don't overlap."""
@@ -401,7 +446,7 @@ class SATEncoder:
                 j_before_i = s2 + dur2 <= s1
 
                 if not i_before_j and not j_before_i:
-                    self._clauses.append([-start1.bool_vars[s1], -start2.bool_vars[s2]])
+                    self._clauses.append([-_lit(start1, s1), -_lit(start2, s2)])
 
     def _encode_cumulative(
         self,
@@ -423,8 +468,8 @@ class SATEncoder:
             active_demands = []
             for i in range(n):
                 for s in range(max(starts[i].lb, t - durations[i] + 1), min(starts[i].ub, t) + 1):
-                    if s in starts[i].bool_vars and s <= t < s + durations[i]:
-                        active_lits.append(starts[i].bool_vars[s])
+                    if starts[i].lb <= s <= starts[i].ub and s <= t < s + durations[i]:
+                        active_lits.append(_lit(starts[i], s))
                         active_demands.append(demands[i])
 
             if not active_lits:
@@ -513,8 +558,8 @@ class SATEncoder:
             for name, val in hints.items():
                 if name in self.model._vars:
                     var = self.model._vars[name]
-                    if val in var.bool_vars:
-                        assumptions.append(var.bool_vars[val])
+                    if var.lb <= val <= var.ub:
+                        assumptions.append(_lit(var, val))
 
         sat_result = solve_sat(
             self._clauses,
@@ -535,8 +580,8 @@ class SATEncoder:
             for name, var in self.model._vars.items():
                 if name.startswith("_"):
                     continue
-                for val, bool_var in var.bool_vars.items():
-                    if sat_sol.get(bool_var, False):
+                for val in range(var.lb, var.ub + 1):
+                    if sat_sol.get(_lit(var, val), False):
                         cp_sol[name] = val
                         break
             return cp_sol
@@ -3,6 +3,8 @@ Network Flow, for assignment, matching, and bottleneck analysis.
 
 Use max_flow when you need "how much can I push through this network?"
 Use min_cost_flow when cost matters: "what's the cheapest way to route X units?"
+solve_assignment delegates to the O(n³) Hungarian algorithm by default, pass
+method="ssp" to solve it as a min-cost flow instead.
 
     from solvor.flow import max_flow, min_cost_flow
 
@@ -10,9 +12,12 @@ Use min_cost_flow when cost matters: "what's the cheapest way to route X units?"
     result = max_flow(graph, source='s', sink='t')
     result = min_cost_flow(graph, source='s', sink='t', demand=10)
 
-How it works: max_flow uses Ford-Fulkerson with BFS (Edmonds-Karp), repeatedly
-finding augmenting paths until none exist. min_cost_flow uses successive
-shortest paths via Bellman-Ford, finding the cheapest augmenting path each time.
+How it works: max_flow uses Dinic's algorithm, a BFS labels nodes by distance
+from the source, then a DFS pushes blocking flow along level-increasing arcs,
+repeated until the sink is unreachable (O(E·√V) on unit-capacity bipartite
+graphs). min_cost_flow uses successive
+shortest paths via queue-based Bellman-Ford (SPFA), finding the cheapest
+augmenting path each time.
 The max-flow min-cut theorem means you find bottlenecks for free.
 
 Use this for:
@@ -28,6 +33,7 @@ Parameters:
     source: source node
     sink: sink node
     demand: (min_cost_flow only) units to route
+    method: (solve_assignment only) "hungarian" or "ssp"
 
 Works well with NetworkX for graph construction. For heavier graph work
 (shortest paths, centrality, community detection), NetworkX is more extensive.
@@ -35,7 +41,9 @@ Works well with NetworkX for graph construction. For heavier graph work
 
 from collections import defaultdict, deque
 from collections.abc import Sequence
+from typing import Literal
 
+from solvor.hungarian import solve_hungarian  # see hungarian.py
 from solvor.types import Result, Status
 
 __all__ = ["max_flow", "min_cost_flow", "solve_assignment"]
@@ -46,55 +54,69 @@ def max_flow[Node](
     source: Node,
     sink: Node,
 ) -> Result:
-    """Find maximum flow from source to sink using Ford-Fulkerson (FFA) with BFS."""
-    capacity = defaultdict(lambda: defaultdict(int))
-    for u in graph:
-        for v, cap, *_ in graph[u]:
-            capacity[u][v] += cap
+    """Find maximum flow from source to sink using Dinic's algorithm (BFS levels + blocking flows)."""
+    nodes, indptr, head, twin, capacity, _, forward = _to_csr(graph, source, sink)
+    n_nodes = len(nodes)
 
-    flow = defaultdict(lambda: defaultdict(int))
+    residual = capacity[:]
+    s, t = 0, nodes.index(sink)
     total_flow = 0
     iterations = 0
 
-    def bfs():
-        """Find augmenting path from source to sink via BFS."""
-        visited = {source}
-        queue = deque([(source, [source])])
-
+    while s != t:
+        # BFS levels over the residual graph, stop once the sink is unreachable
+        level = [-1] * n_nodes
+        level[s] = 0
+        queue = deque([s])
         while queue:
-            node, path = queue.popleft()
-            if node == sink:
-                return path
-
-            for neighbor in capacity[node]:
-                # Forward capacity minus used, plus reverse flow we can cancel
-                residual = capacity[node][neighbor] - flow[node][neighbor] + flow[neighbor][node]
-                if neighbor not in visited and residual > 0:
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor]))
-
-        return None
-
-    while path := bfs():
-        iterations += 1
-        path_flow = float("inf")
-        for u, v in zip(path, path[1:]):
-            residual = capacity[u][v] - flow[u][v] + flow[v][u]
-            path_flow = min(path_flow, residual)
-
-        for u, v in zip(path, path[1:]):
-            if flow[v][u] > 0:
-                reduce = min(path_flow, flow[v][u])
-                flow[v][u] -= reduce
-                path_flow_remaining = path_flow - reduce
-                flow[u][v] += path_flow_remaining
+            u = queue.popleft()
+            for e in range(indptr[u], indptr[u + 1]):
+                v = head[e]
+                if residual[e] > 0 and level[v] < 0:
+                    level[v] = level[u] + 1
+                    queue.append(v)
+        if level[t] < 0:
+            break
+
+        # Blocking flow: repeated DFS along level-increasing arcs, current-arc pointers
+        # make every saturated or dead-end arc get skipped for the rest of the phase
+        current = indptr[:-1]
+        path = []
+        u = s
+        while True:
+            if u == t:
+                push = min(map(residual.__getitem__, path))
+                for e in path:
+                    residual[e] -= push
+                    residual[twin[e]] += push
+                total_flow += push
+                iterations += 1
+                path.clear()
+                u = s
+                continue
+
+            end = indptr[u + 1]
+            e = current[u]
+            next_level = level[u] + 1
+            while e < end and (residual[e] <= 0 or level[head[e]] != next_level):
+                e += 1
+            current[u] = e
+
+            if e < end:
+                path.append(e)
+                u = head[e]
+            elif path:
+                # Dead end, retreat and skip the arc that led here
+                u = head[twin[path.pop()]]
+                current[u] += 1
             else:
-                flow[u][v] += path_flow
-
-        total_flow += path_flow
+                break
 
-    flows = {(u, v): flow[u][v] for u in flow for v in flow[u] if flow[u][v] > 0}
-    return Result(flows, total_flow, iterations, iterations)
+    flows = defaultdict(int)
+    for e in forward:
+        if capacity[e] > residual[e]:
+            flows[nodes[head[twin[e]]], nodes[head[e]]] += capacity[e] - residual[e]
+    return Result(dict(flows), total_flow, iterations, iterations)
 
 
 def min_cost_flow[Node](
@@ -104,87 +126,137 @@ def min_cost_flow[Node](
     demand: int,
 ) -> Result:
     """Route demand units from source to sink at minimum total cost."""
-    capacity = defaultdict(lambda: defaultdict(int))
-    cost = defaultdict(lambda: defaultdict(lambda: float("inf")))
-    nodes = set()
+    nodes, indptr, head, twin, capacity, cost, forward = _to_csr(graph, source, sink)
+    n_nodes = len(nodes)
 
-    for u in graph:
-        nodes.add(u)
-        for v, cap, c in graph[u]:
-            nodes.add(v)
-            capacity[u][v] += cap
-            cost[u][v] = min(cost[u][v], c)
-            if cost[v][u] == float("inf"):
-                cost[v][u] = -c
-
-    flow = defaultdict(lambda: defaultdict(int))
+    flow = [0] * len(head)
+    s, t = 0, nodes.index(sink)
+    inf = float("inf")
     total_cost = 0
     total_flow = 0
     iterations = 0
 
-    def bellman_ford():
-        dist = {n: float("inf") for n in nodes}
-        parent = {n: None for n in nodes}
-        dist[source] = 0
-
-        for _ in range(len(nodes) - 1):
-            updated = False
-            for u in nodes:
-                if dist[u] == float("inf"):
-                    continue
-                for v in nodes:
-                    residual = capacity[u][v] - flow[u][v] + flow[v][u]
-                    if residual > 0 and dist[u] + cost[u][v] < dist[v]:
-                        dist[v] = dist[u] + cost[u][v]
-                        parent[v] = u
-                        updated = True
-            if not updated:
-                break
-
-        if dist[sink] == float("inf"):
-            return None, float("inf")
-
-        path = []
-        node = sink
-        while node is not None:
-            path.append(node)
-            node = parent[node]
-        path.reverse()
-
-        return path, dist[sink]
-
     while total_flow < demand:
         iterations += 1
-        path, path_cost = bellman_ford()
-        if path is None:
+        dist, parent = _bellman_ford(indptr, head, capacity, flow, cost, s, n_nodes)
+        if dist[t] == inf:
             return Result({}, float("inf"), iterations, iterations, Status.INFEASIBLE)
 
-        path_flow = demand - total_flow
-        for u, v in zip(path, path[1:]):
-            residual = capacity[u][v] - flow[u][v] + flow[v][u]
-            path_flow = min(path_flow, residual)
-
-        for u, v in zip(path, path[1:]):
-            if flow[v][u] > 0:
-                reduce = min(path_flow, flow[v][u])
-                flow[v][u] -= reduce
-                remaining = path_flow - reduce
-                flow[u][v] += remaining
-                total_cost += cost[u][v] * remaining - cost[v][u] * reduce
-            else:
-                flow[u][v] += path_flow
-                total_cost += cost[u][v] * path_flow
+        path = []
+        node = t
+        while node != s:
+            e = parent[node]
+            path.append(e)
+            node = head[twin[e]]
+
+        # Bottleneck in one reduction over the path's arc indices
+        path_flow = min([demand - total_flow, *(capacity[e] - flow[e] for e in path)])
+
+        # Skew-symmetric flow: pushing on an arc is cancelling on its twin, no special case
+        for e in path:
+            flow[e] += path_flow
+            flow[twin[e]] -= path_flow
+            total_cost += cost[e] * path_flow
 
         total_flow += path_flow
 
-    flows = {(u, v): flow[u][v] for u in flow for v in flow[u] if flow[u][v] > 0}
-    return Result(flows, total_cost, iterations, iterations)
+    flows = defaultdict(int)
+    for e in forward:
+        if flow[e] > 0:
+            flows[nodes[head[twin[e]]], nodes[head[e]]] += flow[e]
+    return Result(dict(flows), total_cost, iterations, iterations)
+
+
+def _to_csr(graph, source, sink):
+    # Residual graph as flat CSR arrays: arcs leaving node u live in indptr[u]:indptr[u + 1],
+    # every arc is paired with a reverse arc (capacity 0, negated cost) found via twin[e].
+    # Arcs without a cost entry (plain max_flow graphs) get cost 0. Source is node 0, sink comes right after.
+    nodes = list(dict.fromkeys([source, sink, *graph, *(e[0] for u in graph for e in graph[u])]))
+    index = {node: i for i, node in enumerate(nodes)}
+    n_nodes = len(nodes)
+
+    arcs = []
+    for u in graph:
+        for v, cap, *rest in graph[u]:
+            c = rest[0] if rest else 0
+            arcs.append((index[u], index[v], cap, c))
+            arcs.append((index[v], index[u], 0, -c))
+
+    indptr = [0] * (n_nodes + 1)
+    for tail, *_ in arcs:
+        indptr[tail + 1] += 1
+    for u in range(n_nodes):
+        indptr[u + 1] += indptr[u]
+    fill = indptr[:-1]
+    position = [0] * len(arcs)
+    for k, (tail, *_) in enumerate(arcs):
+        position[k] = fill[tail]
+        fill[tail] += 1
+
+    n_arcs = len(arcs)
+    head = [0] * n_arcs
+    capacity = [0] * n_arcs
+    cost = [0] * n_arcs
+    twin = [0] * n_arcs
+    for k, (_, v, cap, c) in enumerate(arcs):
+        e = position[k]
+        head[e] = v
+        capacity[e] = cap
+        cost[e] = c
+        twin[e] = position[k ^ 1]
+    forward = [position[k] for k in range(0, n_arcs, 2)]
+    return nodes, indptr, head, twin, capacity, cost, forward
+
+
+def _bellman_ford(indptr, head, capacity, flow, cost, source, n_nodes):
+    # Queue-based Bellman-Ford (SPFA): only nodes whose distance improved get relaxed again.
+    # Module-level kernel so every array is a fast local rather than a closure cell.
+    inf = float("inf")
+    dist = [inf] * n_nodes
+    parent = [-1] * n_nodes
+    dist[source] = 0
+    in_queue = [False] * n_nodes
+    in_queue[source] = True
+    enqueued = [0] * n_nodes
+    queue = deque([source])
+
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = False
+        du = dist[u]
+        for e in range(indptr[u], indptr[u + 1]):
+            if flow[e] < capacity[e]:
+                v = head[e]
+                d = du + cost[e]
+                if d < dist[v]:
+                    dist[v] = d
+                    parent[v] = e
+                    if not in_queue[v]:
+                        # Same bound as V - 1 passes, stops on negative cycles
+                        enqueued[v] += 1
+                        if enqueued[v] >= n_nodes:
+                            return dist, parent
+                        in_queue[v] = True
+                        # Smallest-label-first: promising nodes jump the queue
+                        if queue and d < dist[queue[0]]:
+                            queue.appendleft(v)
+                        else:
+                            queue.append(v)
+
+    return dist, parent
 
 
 def solve_assignment(
     cost_matrix: Sequence[Sequence[float]],
+    *,
+    method: Literal["hungarian", "ssp"] = "hungarian",
 ) -> Result:
-    """Solve assignment problem via min-cost flow reduction."""
+    """Solve assignment problem, via Hungarian (default) or min-cost flow reduction (ssp)."""
+    if method == "hungarian":
+        return solve_hungarian(cost_matrix)
+    if method != "ssp":
+        raise ValueError(f"method must be 'hungarian' or 'ssp', got '{method}'")
+
     n = len(cost_matrix)
     m = len(cost_matrix[0]) if n > 0 else 0
 
@@ -192,21 +264,19 @@ def solve_assignment(
     source, sink = "source", "sink"
 
     for i in range(n):
-        graph[source].append((f"L{i}", 1, 0))
+        graph[source].append((("L", i), 1, 0))
         for j in range(m):
-            graph[f"L{i}"].append((f"R{j}", 1, cost_matrix[i][j]))
+            graph[("L", i)].append((("R", j), 1, cost_matrix[i][j]))
 
     for j in range(m):
-        graph[f"R{j}"].append((sink, 1, 0))
+        graph[("R", j)].append((sink, 1, 0))
 
     result = min_cost_flow(graph, source, sink, min(n, m))
 
     assignment = [-1] * n
-    flow_solution: dict[tuple[str, str], float] = result.solution  # type: ignore[assignment]
+    flow_solution: dict = result.solution  # type: ignore[assignment]
     for (u, v), f in flow_solution.items():
-        if f > 0 and u.startswith("L") and v.startswith("R"):
-            i = int(u[1:])
-            j = int(v[1:])
-            assignment[i] = j
+        if f > 0 and u[0] == "L" and v[0] == "R":
+            assignment[u[1]] = v[1]
 
     return Result(assignment, result.objective, result.iterations, result.evaluations, result.status)
@@ -35,6 +35,7 @@ Parameters:
     elite_size: survivors per generation (default: 2)
     mutation_rate: how often to mutate (default: 0.1)
     tournament_k: selection pressure (default: 3)
+    cache: skip re-evaluating recently seen tuple/list solutions (default: False)
 
 Don't use this for: problems with gradient info (use gradient descent), convex
 problems (use simplex), or discrete structured problems (use CP/SAT).
@@ -42,6 +43,7 @@ problems (use simplex), or discrete structured problems (use CP/SAT).
 
 from collections import namedtuple
 from collections.abc import Callable, Sequence
+from itertools import batched
 from operator import attrgetter
 from random import Random
 
@@ -65,6 +67,7 @@ def evolve[T](
     adaptive_mutation: bool = False,
     max_iter: int = 100,
     tournament_k: int = 3,
+    cache: bool = False,
     seed: int | None = None,
     on_progress: ProgressCallback | None = None,
     progress_interval: int = 0,
@@ -75,38 +78,62 @@ def evolve[T](
     Args:
         adaptive_mutation: If True, increase mutation rate when population
             diversity is low (stagnation), decrease when improving.
+        cache: If True, remember the fitness of recent tuple or list solutions,
+            keyed by their contents, so repeats aren't re-evaluated. Only for
+            deterministic objectives.
     """
     rng = Random(seed)
     evaluate = Evaluator(objective_fn, minimize)
     pop_size = len(population)
-
-    pop = [Individual(sol, evaluate(sol)) for sol in population]
+    seen: dict = {}
+    max_seen = 10 * pop_size
+
+    def fitness(sol):
+        if not cache or not isinstance(sol, (tuple, list)):
+            return evaluate(sol)
+        key = tuple(sol)
+        try:
+            return seen[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return evaluate(sol)
+        value = seen[key] = evaluate(sol)
+        if len(seen) > max_seen:
+            del seen[next(iter(seen))]
+        return value
+
+    pop = [Individual(sol, fitness(sol)) for sol in population]
     pop.sort(key=attrgetter("fitness"))
     best_solution = pop[0].solution
     best_fitness = pop[0].fitness
 
-    def tournament():
-        contestants = rng.sample(pop, min(tournament_k, len(pop)))
-        return min(contestants, key=attrgetter("fitness"))
+    ranks = range(pop_size)
 
     current_mutation_rate = mutation_rate
     stagnation_count = 0
 
     for iteration in range(max_iter):
         new_pop = pop[:elite_size]
+        n_children = pop_size - len(new_pop)
+
+        # All tournaments for the generation in one draw. pop is sorted by fitness,
+        # so each tournament is won by its lowest rank
+        winners = map(min, batched(rng.choices(ranks, k=2 * n_children * tournament_k), tournament_k))
 
-        while len(new_pop) < pop_size:
-            p1 = tournament()
-            p2 = tournament()
-            child_sol = crossover(p1.solution, p2.solution)
+        for r1, r2 in zip(winners, winners):
+            child_sol = crossover(pop[r1].solution, pop[r2].solution)
 
             if rng.random() < current_mutation_rate:
                 child_sol = mutate(child_sol)
 
-            child = Individual(child_sol, evaluate(child_sol))
+            child = Individual(child_sol, fitness(child_sol))
             new_pop.append(child)
 
-        pop = sorted(new_pop, key=attrgetter("fitness"))[:pop_size]
+        # new_pop is exactly pop_size long and starts with the sorted elites, which
+        # Timsort takes as one ready-made run
+        new_pop.sort(key=attrgetter("fitness"))
+        pop = new_pop
 
         improved = False
         if pop[0].fitness < best_fitness:
@@ -40,12 +40,16 @@ Parameters:
 Warning: gradient descent finds local minima, not global ones. If you suspect
 multiple optima, use anneal or genetic to explore first.
 
+State is kept in plain Python float lists (64-bit). grad_fn may return any
+numeric sequence, it is read once per step and never stored.
+
 Don't use this for: non-differentiable functions, discrete problems, or when
-you don't have access to gradients.
+you don't have access to gradients. For ML-scale parameter vectors (millions
+of float32 weights), use a NumPy/PyTorch optimizer, that's what they're for.
 """
 
 from collections.abc import Callable, Sequence
-from math import cos, pi, sqrt
+from math import cos, inf, pi, sqrt, sumprod
 
 from solvor.types import ProgressCallback, Result, Status
 from solvor.utils.helpers import report_progress
@@ -64,12 +68,13 @@ def _armijo_line_search(
     max_backtracks: int = 20,
 ) -> tuple[float, int]:
     f_x = objective_fn(x)
-    grad_norm_sq = sum(g * g for g in grad)
+    grad_norm_sq = sumprod(grad, grad)
     evals = 1
 
     lr = initial_lr
     for _ in range(max_backtracks):
-        x_new = [x[i] - sign * lr * grad[i] for i in range(len(x))]
+        step = sign * lr
+        x_new = [xi - step * g for xi, g in zip(x, grad)]
         f_new = objective_fn(x_new)
         evals += 1
 
@@ -99,31 +104,30 @@ def gradient_descent(
 
     sign = 1 if minimize else -1
     x = list(x0)
-    n = len(x)
     evals = 0
+    grad_norm = inf
 
     for iteration in range(max_iter):
         grad = grad_fn(x)
         evals += 1
 
-        grad_norm = sqrt(sum(g * g for g in grad))
+        grad_norm = sqrt(sumprod(grad, grad))
         if grad_norm < tol:
             return Result(x, grad_norm, iteration, evals)
 
         if line_search and objective_fn is not None:
             step, ls_evals = _armijo_line_search(x, grad, objective_fn, sign, lr)
             evals += ls_evals
-            for i in range(n):
-                x[i] -= sign * step * grad[i]
+            step *= sign
         else:
-            for i in range(n):
-                x[i] -= sign * lr * grad[i]
+            step = sign * lr
+        x = [xi - step * g for xi, g in zip(x, grad)]
 
         if report_progress(on_progress, progress_interval, iteration + 1, grad_norm, grad_norm, evals):
             return Result(x, grad_norm, iteration + 1, evals, Status.FEASIBLE)
 
-    grad_norm = sqrt(sum(g * g for g in grad_fn(x)))
-    return Result(x, grad_norm, max_iter, evals + 1, Status.MAX_ITER)
+    # Reports the norm from the last step rather than paying one more grad_fn call
+    return Result(x, grad_norm, max_iter, evals, Status.MAX_ITER)
 
 
 def momentum(
@@ -143,24 +147,23 @@ def momentum(
     n = len(x)
     v = [0.0] * n
     evals = 0
+    grad_norm = inf
 
     for iteration in range(max_iter):
         grad = grad_fn(x)
         evals += 1
 
-        grad_norm = sqrt(sum(g * g for g in grad))
+        grad_norm = sqrt(sumprod(grad, grad))
         if grad_norm < tol:
             return Result(x, grad_norm, iteration, evals)
 
-        for i in range(n):
-            v[i] = beta * v[i] + sign * grad[i]
-            x[i] -= lr * v[i]
+        v = [beta * vi + sign * g for vi, g in zip(v, grad)]
+        x = [xi - lr * vi for xi, vi in zip(x, v)]
 
         if report_progress(on_progress, progress_interval, iteration + 1, grad_norm, grad_norm, evals):
             return Result(x, grad_norm, iteration + 1, evals, Status.FEASIBLE)
 
-    grad_norm = sqrt(sum(g * g for g in grad_fn(x)))
-    return Result(x, grad_norm, max_iter, evals + 1, Status.MAX_ITER)
+    return Result(x, grad_norm, max_iter, evals, Status.MAX_ITER)
 
 
 def rmsprop(
@@ -180,26 +183,27 @@ def rmsprop(
     x = list(x0)
     n = len(x)
     v = [0.0] * n
+    one_minus_decay = 1 - decay
+    signed_lr = sign * lr
     evals = 0
+    grad_norm = inf
 
     for iteration in range(max_iter):
         grad = grad_fn(x)
         evals += 1
 
-        grad_norm = sqrt(sum(g * g for g in grad))
+        grad_norm = sqrt(sumprod(grad, grad))
         if grad_norm < tol:
             return Result(x, grad_norm, iteration, evals)
 
-        for i in range(n):
-            g = sign * grad[i]
-            v[i] = decay * v[i] + (1 - decay) * g * g
-            x[i] -= lr * g / (sqrt(v[i]) + eps)
+        # Straight off grad, the sign only matters in the step
+        v = [decay * vi + one_minus_decay * gi * gi for vi, gi in zip(v, grad)]
+        x = [xi - signed_lr * gi / (sqrt(vi) + eps) for xi, gi, vi in zip(x, grad, v)]
 
         if report_progress(on_progress, progress_interval, iteration + 1, grad_norm, grad_norm, evals):
             return Result(x, grad_norm, iteration + 1, evals, Status.FEASIBLE)
 
-    grad_norm = sqrt(sum(g * g for g in grad_fn(x)))
-    return Result(x, grad_norm, max_iter, evals + 1, Status.MAX_ITER)
+    return Result(x, grad_norm, max_iter, evals, Status.MAX_ITER)
 
 
 def adam(
@@ -236,7 +240,11 @@ def adam(
     n = len(x)
     m = [0.0] * n
     v = [0.0] * n
+    signed_beta1 = sign * (1 - beta1)
+    one_minus_beta2 = 1 - beta2
+    beta1_pow = beta2_pow = 1.0
     evals = 0
+    grad_norm = inf
 
     def get_lr(t):
         if lr_schedule == "constant":
@@ -259,24 +267,23 @@ def adam(
         grad = grad_fn(x)
         evals += 1
 
-        grad_norm = sqrt(sum(g * g for g in grad))
+        grad_norm = sqrt(sumprod(grad, grad))
         if grad_norm < tol:
             return Result(x, grad_norm, iteration, evals)
 
         current_lr = get_lr(iteration)
 
-        for i in range(n):
-            g = sign * grad[i]
-            m[i] = beta1 * m[i] + (1 - beta1) * g
-            v[i] = beta2 * v[i] + (1 - beta2) * g * g
-
-            m_hat = m[i] / (1 - beta1**iteration)
-            v_hat = v[i] / (1 - beta2**iteration)
-
-            x[i] -= current_lr * m_hat / (sqrt(v_hat) + eps)
+        # Whole-list updates straight off grad, sign lives in signed_beta1 (g * g
+        # doesn't need it), bias corrections from running powers of beta
+        m = [beta1 * mi + signed_beta1 * gi for mi, gi in zip(m, grad)]
+        v = [beta2 * vi + one_minus_beta2 * gi * gi for vi, gi in zip(v, grad)]
+        beta1_pow *= beta1
+        beta2_pow *= beta2
+        bc1 = 1 - beta1_pow
+        bc2 = 1 - beta2_pow
+        x = [xi - current_lr * (mi / bc1) / (sqrt(vi / bc2) + eps) for xi, mi, vi in zip(x, m, v)]
 
         if report_progress(on_progress, progress_interval, iteration, grad_norm, grad_norm, evals):
             return Result(x, grad_norm, iteration, evals, Status.FEASIBLE)
 
-    grad_norm = sqrt(sum(g * g for g in grad_fn(x)))
-    return Result(x, grad_norm, max_iter, evals + 1, Status.MAX_ITER)
+    return Result(x, grad_norm, max_iter, evals, Status.MAX_ITER)
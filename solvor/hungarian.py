@@ -57,43 +57,45 @@ def solve_hungarian(
     n_cols = len(cost_matrix[0])
     n = max(n_rows, n_cols)
 
-    matrix = [[0.0] * n for _ in range(n)]
-    for i in range(n_rows):
-        for j in range(n_cols):
-            matrix[i][j] = cost_matrix[i][j]
-
-    if not minimize:
+    # Rows padded with a leading 0 so column j (1-indexed) reads matrix[i][j] directly
+    matrix = [[0.0] * (n + 1) for _ in range(n)]
+    if minimize:
+        for i in range(n_rows):
+            matrix[i][1 : n_cols + 1] = cost_matrix[i][:n_cols]
+    else:
         max_val = max(cost_matrix[i][j] for i in range(n_rows) for j in range(n_cols))
-        for i in range(n):
-            for j in range(n):
-                if i < n_rows and j < n_cols:
-                    matrix[i][j] = max_val - cost_matrix[i][j]
-                else:
-                    matrix[i][j] = 0.0
+        for i in range(n_rows):
+            matrix[i][1 : n_cols + 1] = [max_val - c for c in cost_matrix[i][:n_cols]]
 
     row_potential = [0.0] * (n + 1)
     col_potential = [0.0] * (n + 1)
     col_match = [0] * (n + 1)
     augment_path = [0] * (n + 1)
+    inf = float("inf")
+    cols = range(1, n + 1)
 
     iterations = 0
 
     for i in range(1, n + 1):
         col_match[0] = i
         current_col = 0
-        min_slack = [float("inf")] * (n + 1)
+        min_slack = [inf] * (n + 1)
         used = [False] * (n + 1)
+        # Columns visited in this phase, only these get their potentials shifted
+        visited = [0]
 
         while col_match[current_col] != 0:
             iterations += 1
             used[current_col] = True
             matched_row = col_match[current_col]
-            delta = float("inf")
+            row = matrix[matched_row - 1]
+            u = row_potential[matched_row]
+            delta = inf
             next_col = 0
 
-            for j in range(1, n + 1):
+            for j in cols:
                 if not used[j]:
-                    reduced_cost = matrix[matched_row - 1][j - 1] - row_potential[matched_row] - col_potential[j]
+                    reduced_cost = row[j] - u - col_potential[j]
                     if reduced_cost < min_slack[j]:
                         min_slack[j] = reduced_cost
                         augment_path[j] = current_col
@@ -101,13 +103,14 @@ def solve_hungarian(
                         delta = min_slack[j]
                         next_col = j
 
-            for j in range(n + 1):
-                if used[j]:
-                    row_potential[col_match[j]] += delta
-                    col_potential[j] -= delta
-                else:
+            for j in visited:
+                row_potential[col_match[j]] += delta
+                col_potential[j] -= delta
+            for j in cols:
+                if not used[j]:
                     min_slack[j] -= delta
 
+            visited.append(next_col)
             current_col = next_col
 
         while current_col != 0:
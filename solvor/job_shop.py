@@ -38,6 +38,7 @@ approximate solutions surprisingly fast.
 
 from collections.abc import Sequence
 from random import Random
+from typing import NamedTuple
 
 from solvor.types import ProgressCallback, Result, Status
 from solvor.utils.helpers import report_progress
@@ -48,6 +49,23 @@ __all__ = ["solve_job_shop"]
 Operation = tuple[int, int]  # (machine, duration)
 Job = Sequence[Operation]
 
+# Dispatching rules as ints so the selection loop never compares strings
+_FIFO, _SPT, _LPT, _MWKR, _RANDOM = range(5)
+_RULES = {"fifo": _FIFO, "spt": _SPT, "lpt": _LPT, "mwkr": _MWKR, "random": _RANDOM}
+
+
+class _Schedule(NamedTuple):
+    # Start and end times as flat per-job lists: start[j][op], end[j][op]
+    start: list[list[int]]
+    end: list[list[int]]
+
+    def as_dict(self) -> dict[tuple[int, int], tuple[int, int]]:
+        return {
+            (j, op): (s, e)
+            for j, (starts, ends) in enumerate(zip(self.start, self.end))
+            for op, (s, e) in enumerate(zip(starts, ends))
+        }
+
 
 def solve_job_shop(
     jobs: Sequence[Job],
@@ -76,19 +94,30 @@ def solve_job_shop(
                 raise ValueError(f"Job {j} operation {op_idx} has negative duration")
             n_machines = max(n_machines, machine + 1)
 
+    # Machine and duration of each operation as per-job lists, unpacked once here
+    # so the hot loops below index them directly: machine_of[j][op], duration_of[j][op]
+    machine_of = [[m for m, _ in job] for job in jobs]
+    duration_of = [[d for _, d in job] for job in jobs]
+
     rng = Random(seed)
     evals = 0
 
     # Generate initial schedule using dispatching rule
-    schedule = _dispatch(jobs, n_machines, rule, rng)
-    makespan = _compute_makespan(jobs, schedule)
+    schedule = _dispatch(machine_of, duration_of, n_machines, rule, rng)
+    makespan = _compute_makespan(schedule)
     evals += 1
 
     best_schedule = schedule
     best_makespan = makespan
 
     if not local_search:
-        return Result(best_schedule, float(best_makespan), 0, evals, Status.FEASIBLE)
+        return Result(best_schedule.as_dict(), float(best_makespan), 0, evals, Status.FEASIBLE)
+
+    # Operations per machine, built once and re-sorted by start time when visited
+    machine_ops: list[list[tuple[int, int]]] = [[] for _ in range(n_machines)]
+    for j, machines in enumerate(machine_of):
+        for op_idx, m in enumerate(machines):
+            machine_ops[m].append((j, op_idx))
 
     # Local search: swap adjacent operations on same machine
     no_improve = 0
@@ -99,18 +128,12 @@ def solve_job_shop(
         improved = False
         machine = rng.randrange(n_machines)
 
-        # Get operations on this machine in current order
-        ops_on_machine = []
-        for j, job in enumerate(jobs):
-            for op_idx, (m, _) in enumerate(job):
-                if m == machine:
-                    ops_on_machine.append((j, op_idx))
-
-        if len(ops_on_machine) < 2:
+        if len(machine_ops[machine]) < 2:
             continue
 
-        # Sort by start time
-        ops_on_machine.sort(key=lambda x: schedule[(x[0], x[1])][0])
+        # Operations on this machine in current order (by start time)
+        start = schedule.start
+        ops_on_machine = sorted(machine_ops[machine], key=lambda x: start[x[0]][x[1]])
 
         # Try swapping adjacent pairs
         for i in range(len(ops_on_machine) - 1):
@@ -118,14 +141,16 @@ def solve_job_shop(
             j2, op2 = ops_on_machine[i + 1]
 
             # Check if swap is valid (doesn't violate job precedence)
-            new_schedule = _try_swap(jobs, schedule, j1, op1, j2, op2)
-            if new_schedule is None:
+            swapped = _try_swap(
+                machine_of, duration_of, n_machines, schedule, ops_on_machine, j1, op1, j2, op2, makespan
+            )
+            if swapped is None:
                 continue
 
-            new_makespan = _compute_makespan(jobs, new_schedule)
+            new_schedule, new_makespan = swapped
             evals += 1
 
-            if new_makespan < makespan:
+            if new_schedule is not None and new_makespan < makespan:
                 schedule = new_schedule
                 makespan = new_makespan
                 improved = True
@@ -145,19 +170,21 @@ def solve_job_shop(
 
         obj = float(best_makespan)
         if report_progress(on_progress, progress_interval, iteration, obj, obj, evals):
-            return Result(best_schedule, obj, iteration, evals, Status.FEASIBLE)
+            return Result(best_schedule.as_dict(), obj, iteration, evals, Status.FEASIBLE)
 
-    return Result(best_schedule, float(best_makespan), iteration, evals, Status.FEASIBLE)
+    return Result(best_schedule.as_dict(), float(best_makespan), iteration, evals, Status.FEASIBLE)
 
 
 def _dispatch(
-    jobs: Sequence[Job],
+    machine_of: list[list[int]],
+    duration_of: list[list[int]],
     n_machines: int,
     rule: str,
     rng: Random,
-) -> dict[tuple[int, int], tuple[int, int]]:
-    """Generate schedule using dispatching rule. Returns {(job, op): (start, end)}."""
-    n_jobs = len(jobs)
+) -> _Schedule:
+    """Generate schedule using dispatching rule."""
+    n_jobs = len(machine_of)
+    n_ops = [len(machines) for machines in machine_of]
 
     # Track next operation index for each job
     next_op = [0] * n_jobs
@@ -168,50 +195,47 @@ def _dispatch(
     # Track when each job's last operation ends
     job_free = [0] * n_jobs
 
-    schedule: dict[tuple[int, int], tuple[int, int]] = {}
+    start_of = [[0] * k for k in n_ops]
+    end_of = [[0] * k for k in n_ops]
 
     # Compute total remaining work for each job (for MWKR rule)
-    remaining_work = [sum(d for _, d in job) for job in jobs]
+    remaining_work = [sum(durations) for durations in duration_of]
 
-    total_ops = sum(len(job) for job in jobs)
+    total_ops = sum(n_ops)
 
-    for _ in range(total_ops):
-        # Find ready operations (next operation of each job that's ready)
-        ready = []
-        for j in range(n_jobs):
-            if next_op[j] < len(jobs[j]):
-                machine, duration = jobs[j][next_op[j]]
-                ready.append((j, next_op[j], machine, duration))
-
-        if not ready:
-            break
+    rule_code = _RULES.get(rule.lower())
+    if rule_code is None:
+        raise ValueError(f"Unknown dispatching rule: {rule}")
 
-        # Select operation based on rule
-        rule_lower = rule.lower()
-        if rule_lower == "fifo":
-            # First ready (by job index)
-            selected = ready[0]
-        elif rule_lower == "spt":
-            # Shortest Processing Time
-            selected = min(ready, key=lambda x: x[3])
-        elif rule_lower == "lpt":
-            # Longest Processing Time
-            selected = max(ready, key=lambda x: x[3])
-        elif rule_lower == "mwkr":
-            # Most Work Remaining
-            selected = max(ready, key=lambda x: remaining_work[x[0]])
-        elif rule_lower == "random":
-            selected = rng.choice(ready)
-        else:
-            raise ValueError(f"Unknown dispatching rule: {rule}")
+    # Every rule is "smallest key wins, first job on ties": SPT keys on duration, LPT on
+    # -duration, MWKR on -remaining work, FIFO on a constant (so the first ready job)
+    duration_sign = 1 if rule_code == _SPT else -1 if rule_code == _LPT else 0
+    use_work = rule_code == _MWKR
 
-        j, op_idx, machine, duration = selected
+    for _ in range(total_ops):
+        if rule_code == _RANDOM:
+            j = rng.choice([k for k in range(n_jobs) if next_op[k] < n_ops[k]])
+        else:
+            j = -1
+            best_key = 0
+            for k in range(n_jobs):
+                op_idx = next_op[k]
+                if op_idx == n_ops[k]:
+                    continue
+                key = -remaining_work[k] if use_work else duration_sign * duration_of[k][op_idx]
+                if j < 0 or key < best_key:
+                    j, best_key = k, key
+
+        op_idx = next_op[j]
+        machine = machine_of[j][op_idx]
+        duration = duration_of[j][op_idx]
 
         # Schedule this operation
         start = max(machine_free[machine], job_free[j])
         end = start + duration
 
-        schedule[(j, op_idx)] = (start, end)
+        start_of[j][op_idx] = start
+        end_of[j][op_idx] = end
 
         # Update state
         machine_free[machine] = end
@@ -219,128 +243,127 @@ def _dispatch(
         next_op[j] += 1
         remaining_work[j] -= duration
 
-    return schedule
+    return _Schedule(start_of, end_of)
 
 
-def _compute_makespan(
-    jobs: Sequence[Job],
-    schedule: dict[tuple[int, int], tuple[int, int]],
-) -> int:
+def _compute_makespan(schedule: _Schedule) -> int:
     """Compute makespan (maximum end time) of a schedule."""
-    return max(end for _, end in schedule.values()) if schedule else 0
+    return max(map(max, schedule.end), default=0)
 
 
 def _try_swap(
-    jobs: Sequence[Job],
-    schedule: dict[tuple[int, int], tuple[int, int]],
+    machine_of: list[list[int]],
+    duration_of: list[list[int]],
+    n_machines: int,
+    schedule: _Schedule,
+    machine_order: list[tuple[int, int]],
     j1: int,
     op1: int,
     j2: int,
     op2: int,
-) -> dict[tuple[int, int], tuple[int, int]] | None:
-    """Try swapping two operations on the same machine. Returns new schedule or None."""
+    cutoff: int,
+) -> tuple[_Schedule | None, int] | None:
+    """Try swapping two operations on the same machine. Returns (schedule, makespan) or None."""
     # This is a simplified swap - we rebuild the schedule with swapped priority
     # A full implementation would do critical path analysis
 
-    machine = jobs[j1][op1][0]
-    assert jobs[j2][op2][0] == machine
+    machine = machine_of[j1][op1]
+    assert machine_of[j2][op2] == machine
 
-    # Get all operations on this machine
-    ops_on_machine = []
-    for j, job in enumerate(jobs):
-        for op_idx, (m, _) in enumerate(job):
-            if m == machine:
-                ops_on_machine.append((j, op_idx, schedule[(j, op_idx)][0]))
-
-    # Sort by original start time
-    ops_on_machine.sort(key=lambda x: x[2])
-
-    # Find positions to swap
+    # machine_order is the machine's operations sorted by start time, one pass finds both
     pos1 = pos2 = -1
-    for i, (j, op_idx, _) in enumerate(ops_on_machine):
-        if j == j1 and op_idx == op1:
+    for i, op in enumerate(machine_order):
+        if op == (j1, op1):
             pos1 = i
-        if j == j2 and op_idx == op2:
+        if op == (j2, op2):
             pos2 = i
 
     if pos1 == -1 or pos2 == -1 or abs(pos1 - pos2) != 1:
         return None
 
-    # Swap in the order
-    ops_on_machine[pos1], ops_on_machine[pos2] = ops_on_machine[pos2], ops_on_machine[pos1]
+    # Swap in a copy of the order
+    new_order = machine_order[:]
+    new_order[pos1], new_order[pos2] = new_order[pos2], new_order[pos1]
 
     # Rebuild schedule with new order constraint
-    new_schedule = _rebuild_schedule(jobs, schedule, machine, ops_on_machine)
-    return new_schedule
+    return _rebuild_schedule(machine_of, duration_of, n_machines, schedule, machine, new_order, cutoff)
 
 
 def _rebuild_schedule(
-    jobs: Sequence[Job],
-    old_schedule: dict[tuple[int, int], tuple[int, int]],
+    machine_of: list[list[int]],
+    duration_of: list[list[int]],
+    n_machines: int,
+    old_schedule: _Schedule,
     target_machine: int,
-    machine_order: list[tuple[int, int, int]],
-) -> dict[tuple[int, int], tuple[int, int]]:
-    """Rebuild schedule respecting new machine order."""
-    n_jobs = len(jobs)
-    n_machines = max(jobs[j][op][0] for j in range(n_jobs) for op in range(len(jobs[j]))) + 1
+    machine_order: list[tuple[int, int]],
+    cutoff: int,
+) -> tuple[_Schedule | None, int]:
+    """Rebuild schedule respecting new machine order, returns (schedule, makespan).
+
+    Stops early with (None, makespan so far) once an operation ends at or after
+    cutoff, since the finished schedule could not beat it.
+    """
+    n_jobs = len(machine_of)
+    n_ops = [len(machines) for machines in machine_of]
 
     # Track constraints
     machine_free = [0] * n_machines
     job_free = [0] * n_jobs
 
-    new_schedule: dict[tuple[int, int], tuple[int, int]] = {}
+    start_of = [[0] * k for k in n_ops]
+    end_of = [[0] * k for k in n_ops]
 
     # Process all operations in topological order respecting:
     # 1. Job precedence (earlier ops before later in same job)
     # 2. New machine order for target_machine
 
-    # Build operation list with dependencies
-    all_ops = []
-    for j, job in enumerate(jobs):
-        for op_idx in range(len(job)):
-            all_ops.append((j, op_idx))
-
-    # Sort by: job precedence first, then by specified machine order for target machine
-    machine_order_map = {(j, op): i for i, (j, op, _) in enumerate(machine_order)}
-
-    def op_priority(op_tuple):
-        j, op_idx = op_tuple
-        machine = jobs[j][op_idx][0]
-        # Primary: operation index in job (precedence)
-        # Secondary: position in machine order if on target machine
-        if machine == target_machine:
-            return (op_idx, machine_order_map.get((j, op_idx), 0))
-        return (op_idx, old_schedule[(j, op_idx)][0])
-
-    # Schedule operations greedily
-    scheduled = set()
-    while len(scheduled) < len(all_ops):
-        # Find ready operations
-        ready = []
-        for j, op_idx in all_ops:
-            if (j, op_idx) in scheduled:
-                continue
-            # Check job precedence
-            if op_idx > 0 and (j, op_idx - 1) not in scheduled:
-                continue
-            ready.append((j, op_idx))
+    # Priority: job precedence first (operation index), then position in the new order
+    # on the target machine or the old start time elsewhere. Computed once per rebuild
+    # so the greedy loop below only does lookups.
+    old_start = old_schedule.start
+    machine_pos = {op: i for i, op in enumerate(machine_order)}
+    priority = [
+        [
+            (op_idx, machine_pos.get((j, op_idx), 0) if m == target_machine else old_start[j][op_idx])
+            for op_idx, m in enumerate(machines)
+        ]
+        for j, machines in enumerate(machine_of)
+    ]
 
-        if not ready:
-            break
+    # Only each job's next op can be ready, so next_op replaces a scheduled set
+    next_op = [0] * n_jobs
+    total_ops = sum(n_ops)
 
-        # Sort ready ops by priority
-        ready.sort(key=op_priority)
+    # Schedule operations greedily, tracking the makespan as we go
+    makespan = 0
+    for _ in range(total_ops):
+        # Schedule the ready op with the lowest priority, first job wins ties
+        j = -1
+        best_key = (0, 0)
+        for k in range(n_jobs):
+            op_idx = next_op[k]
+            if op_idx == n_ops[k]:
+                continue
+            key = priority[k][op_idx]
+            if j < 0 or key < best_key:
+                j, best_key = k, key
 
-        # Schedule first ready
-        j, op_idx = ready[0]
-        machine, duration = jobs[j][op_idx]
+        op_idx = next_op[j]
+        machine = machine_of[j][op_idx]
+        duration = duration_of[j][op_idx]
 
         start = max(machine_free[machine], job_free[j])
         end = start + duration
 
-        new_schedule[(j, op_idx)] = (start, end)
+        start_of[j][op_idx] = start
+        end_of[j][op_idx] = end
         machine_free[machine] = end
         job_free[j] = end
-        scheduled.add((j, op_idx))
+        next_op[j] += 1
+
+        if end > makespan:
+            makespan = end
+            if makespan >= cutoff:
+                return None, makespan
 
-    return new_schedule
+    return _Schedule(start_of, end_of), makespan
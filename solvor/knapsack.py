@@ -39,6 +39,9 @@ from solvor.utils import check_non_negative, check_sequence_lengths
 
 __all__ = ["solve_knapsack"]
 
+# Maps a 0/1 bytearray to ASCII digits so int(..., 2) can pack it into a bitset
+_BITS = bytes.maketrans(b"\x00\x01", b"01")
+
 
 def solve_knapsack(
     values: Sequence[float],
@@ -75,27 +78,39 @@ def solve_knapsack(
     # DP table: dp[w] = max value achievable with capacity w
     dp = [0.0] * (int_capacity + 1)
 
-    # Track which items were selected
-    # keep[i][w] = True if item i was taken at capacity w
-    keep = [[False] * (int_capacity + 1) for _ in range(n)]
+    # Track which items were selected, one packed bit row per item:
+    # bit w & 7 of byte keep[i][w >> 3] is set if item i was taken at capacity w
+    keep = []
+    row_bytes = (int_capacity >> 3) + 1
+
+    # Only dp[w] for w >= capacity - (weight of the items still to come) can reach
+    # dp[capacity], so each row stops there instead of at w_i
+    remaining = sum(int_weights)
 
     for i in range(n):
         w_i = int_weights[i]
         v_i = vals[i]
+        keep_i = bytearray(int_capacity + 1)
+        remaining -= w_i
+        lowest = max(w_i, int_capacity - remaining)
 
         # Traverse backwards to avoid using same item twice
-        for w in range(int_capacity, w_i - 1, -1):
-            if dp[w - w_i] + v_i > dp[w]:
-                dp[w] = dp[w - w_i] + v_i
-                keep[i][w] = True
+        for w in range(int_capacity, lowest - 1, -1):
+            candidate = dp[w - w_i] + v_i
+            if candidate > dp[w]:
+                dp[w] = candidate
+                keep_i[w] = 1
+
+        # Pack the row, 1 bit per capacity instead of one list slot
+        keep.append(int(keep_i.translate(_BITS)[::-1], 2).to_bytes(row_bytes, "little"))
 
-    # Backtrack to find selected items
+    # Backtrack to find selected items, one byte lookup per item
     selected = []
     w = int_capacity
-    for i in range(n - 1, -1, -1):
-        if keep[i][w]:
+    for i, row, w_i in zip(range(n - 1, -1, -1), reversed(keep), reversed(int_weights)):
+        if row[w >> 3] >> (w & 7) & 1:
             selected.append(i)
-            w -= int_weights[i]
+            w -= w_i
 
     selected.reverse()
     selected_tuple = tuple(selected)
@@ -47,11 +47,11 @@ CP is more expressive for logical constraints. SAT handles pure boolean.
 For continuous-only problems, use simplex directly.
 """
 
+from array import array
 from collections.abc import Sequence
 from heapq import heappop, heappush
-from math import ceil, floor
+from math import ceil, floor, sumprod
 from random import Random
-from typing import NamedTuple
 
 from solvor.lns import lns as _lns
 from solvor.simplex import Status as LPStatus
@@ -62,14 +62,6 @@ from solvor.utils import check_integers_valid, check_matrix_dims, warn_large_coe
 __all__ = ["solve_milp"]
 
 
-# I deliberately picked NamedTuple over dataclass for performance
-class Node(NamedTuple):
-    bound: float
-    lower: tuple[float, ...]
-    upper: tuple[float, ...]
-    depth: int
-
-
 def solve_milp(
     c: Sequence[float],
     A: Sequence[Sequence[float]],
@@ -93,7 +85,16 @@ def solve_milp(
     check_integers_valid(integers, n)
     warn_large_coefficients(A)
 
-    int_set = set(integers)
+    # Convert inputs once. Every node hands the rows to solve_lp, which copies each one
+    # with array("d", row), a plain memory copy when the row is already a float array.
+    c = [float(v) for v in c]
+    A = [array("d", row) for row in A]
+    b = [float(v) for v in b]
+
+    # Sorted once so every node scans integer variables in index order, which also makes
+    # ties in the branching choice go to the lowest index (check_integers_valid rules out
+    # duplicates and out-of-range indices)
+    int_vars = sorted(integers)
     total_iters = 0
 
     lower = [0.0] * n
@@ -115,28 +116,28 @@ def solve_milp(
     # Use warm start as initial incumbent if provided and feasible
     if warm_start is not None:
         ws = tuple(warm_start)
-        if len(ws) == n and _is_feasible(ws, A, b, int_set, eps):
+        if len(ws) == n and _is_feasible(ws, A, b, int_vars, eps):
             best_obj = sum(c[j] * ws[j] for j in range(n))
             best_solution = ws
             all_solutions.append(ws)
 
-    frac_var = _most_fractional(root_result.solution, int_set, eps)
+    frac_var = _most_fractional(root_result.solution, int_vars, eps)
 
     if frac_var is None:
         return Result(root_result.solution, root_result.objective, 1, total_iters)
 
     # Check if LP relaxation suggests binary (values in [0,1])
-    looks_binary = all(-eps <= root_result.solution[j] <= 1 + eps for j in int_set)
+    looks_binary = all(-eps <= root_result.solution[j] <= 1 + eps for j in int_vars)
 
     # Only tighten bounds if explicit x_j <= 1 constraints exist
-    if looks_binary and _detect_binary(A, b, int_set, n, eps):
-        for j in int_set:
+    if looks_binary and _detect_binary(A, b, int_vars, n, eps):
+        for j in int_vars:
             lower[j] = max(lower[j], 0.0)
             upper[j] = min(upper[j], 1.0)
 
     # Run heuristics if LP looks binary (even without explicit constraints)
     if heuristics and looks_binary and best_solution is None:
-        rounded = _round_binary(root_result.solution, int_set, c, A, b, minimize, eps)
+        rounded = _round_binary(root_result.solution, int_vars, c, A, b, minimize, eps)
         if rounded is not None:
             best_obj = sum(c[j] * rounded[j] for j in range(n))
             best_solution = rounded
@@ -146,7 +147,7 @@ def solve_milp(
     if heuristics and looks_binary and lns_iterations > 0 and best_solution is not None:
         rng = Random(seed)
         improved, iters = _lns_improve(
-            best_solution, c, A, b, int_set, minimize, eps, max_iter, lns_iterations, lns_destroy_frac, rng
+            best_solution, c, A, b, int_vars, minimize, eps, max_iter, lns_iterations, lns_destroy_frac, rng
         )
         total_iters += iters
         if improved is not None:
@@ -156,21 +157,23 @@ def solve_milp(
                 if improved not in all_solutions:
                     all_solutions.append(improved)
 
-    tree: list[tuple[float, int, Node]] = []
+    # Heap entries are flat (bound, counter, lower, upper) tuples, one allocation per node.
+    # The unique counter breaks ties, so the bound tuples are never compared.
+    tree: list[tuple[float, int, tuple[float, ...], tuple[float, ...]]] = []
     counter = 0
     root_bound = sign * root_result.objective
-    heappush(tree, (root_bound, counter, Node(root_bound, tuple(lower), tuple(upper), 0)))
+    heappush(tree, (root_bound, counter, tuple(lower), tuple(upper)))
     counter += 1
     nodes_explored = 0
 
     while tree and nodes_explored < max_nodes:
-        node_bound, _, node = heappop(tree)
+        node_bound, _, node_lower, node_upper = heappop(tree)
 
         # Prune if can't improve
         if best_solution is not None and node_bound >= sign * best_obj - eps:
             continue
 
-        result = _solve_node(c, A, b, node.lower, node.upper, minimize, eps, max_iter)
+        result = _solve_node(c, A, b, node_lower, node_upper, minimize, eps, max_iter)
         total_iters += result.iterations
         nodes_explored += 1
 
@@ -180,7 +183,7 @@ def solve_milp(
         if best_solution is not None and sign * result.objective >= sign * best_obj - eps:
             continue
 
-        frac_var = _most_fractional(result.solution, int_set, eps)
+        frac_var = _most_fractional(result.solution, int_vars, eps)
 
         if frac_var is None:
             # Found an integer-feasible solution
@@ -211,16 +214,13 @@ def solve_milp(
         val = result.solution[frac_var]
         child_bound = sign * result.objective
 
-        lower_left, upper_left = list(node.lower), list(node.upper)
-        upper_left[frac_var] = floor(val)
-        heappush(tree, (child_bound, counter, Node(child_bound, tuple(lower_left), tuple(upper_left), node.depth + 1)))
+        # Each child changes one bound, so it shares the other (immutable) bound tuple with its parent
+        upper_left = (*node_upper[:frac_var], floor(val), *node_upper[frac_var + 1 :])
+        heappush(tree, (child_bound, counter, node_lower, upper_left))
         counter += 1
 
-        lower_right, upper_right = list(node.lower), list(node.upper)
-        lower_right[frac_var] = ceil(val)
-        heappush(
-            tree, (child_bound, counter, Node(child_bound, tuple(lower_right), tuple(upper_right), node.depth + 1))
-        )
+        lower_right = (*node_lower[:frac_var], ceil(val), *node_lower[frac_var + 1 :])
+        heappush(tree, (child_bound, counter, lower_right, node_upper))
         counter += 1
 
     if best_solution is None:
@@ -256,15 +256,15 @@ def _solve_node(c, A, b, lower, upper, minimize, eps, max_iter):
                 return Result(None, float("inf") if minimize else float("-inf"), 0, 0, LPStatus.INFEASIBLE)
         return Result(tuple(sol), obj, 0, 0, LPStatus.OPTIMAL)
 
-    # Build reduced problem
+    # Build reduced problem, the constraint rows are shared as-is when nothing is fixed
+    # (solve_lp copies them into its tableau) and gathered column-wise otherwise
     n_free = len(free_vars)
-    A_red, b_red = [], []
-
-    for i, row in enumerate(A):
-        fixed_contrib = sum(row[j] * fixed[j] for j in fixed)
-        new_rhs = b[i] - fixed_contrib
-        A_red.append([row[j] for j in free_vars])
-        b_red.append(new_rhs)
+    if fixed:
+        fixed_vars, fixed_vals = list(fixed), list(fixed.values())
+        A_red = [list(map(row.__getitem__, free_vars)) for row in A]
+        b_red = [b[i] - sumprod(map(row.__getitem__, fixed_vars), fixed_vals) for i, row in enumerate(A)]
+    else:
+        A_red, b_red = list(A), list(b)
 
     # Only add non-trivial bounds
     for j_new, j_old in enumerate(free_vars):
@@ -298,12 +298,15 @@ def _solve_node(c, A, b, lower, upper, minimize, eps, max_iter):
     return Result(tuple(full_sol), result.objective + fixed_obj, result.iterations, result.iterations, result.status)
 
 
-def _most_fractional(solution, int_set, eps):
-    best_var, best_frac = None, 0.0
-    for j in int_set:
-        val = solution[j]
-        frac = abs(val - round(val))
-        if frac > eps and frac > best_frac:
+def _most_fractional(solution, int_vars, eps):
+    # Distance to the nearest integer from val % 1.0, no round()/abs() calls per variable.
+    # Starting the running best at eps folds the tolerance check into the comparison.
+    best_var, best_frac = None, eps
+    for j in int_vars:
+        frac = solution[j] % 1.0
+        if frac > 0.5:
+            frac = 1.0 - frac
+        if frac > best_frac:
             best_var, best_frac = j, frac
     return best_var
 
@@ -314,7 +317,7 @@ def _compute_gap(best_obj, bound):
     return abs(best_obj - bound) / abs(best_obj)
 
 
-def _detect_binary(A, b, int_set, n, eps):
+def _detect_binary(A, b, int_vars, n, eps):
     """Check if integer variables have explicit x_j <= 1 constraints."""
     bounded = set()
     for i, row in enumerate(A):
@@ -324,16 +327,17 @@ def _detect_binary(A, b, int_set, n, eps):
         nz = [(j, row[j]) for j in range(n) if abs(row[j]) > eps]
         if len(nz) == 1:
             j, coef = nz[0]
-            if j in int_set and abs(coef - 1.0) < eps:
+            if abs(coef - 1.0) < eps:
                 bounded.add(j)
-    return len(bounded) == len(int_set) and len(int_set) > 0
+    bounded.intersection_update(int_vars)
+    return len(bounded) == len(int_vars) and len(int_vars) > 0
 
 
-def _is_feasible(x, A, b, int_set, eps):
+def _is_feasible(x, A, b, int_vars, eps):
     n = len(x)
     if any(x[j] < -eps for j in range(n)):
         return False
-    for j in int_set:
+    for j in int_vars:
         if abs(x[j] - round(x[j])) > eps:
             return False
     for i, row in enumerate(A):
@@ -343,7 +347,7 @@ def _is_feasible(x, A, b, int_set, eps):
     return True
 
 
-def _round_binary(lp_solution, int_set, c, A, b, minimize, eps):
+def _round_binary(lp_solution, int_vars, c, A, b, minimize, eps):
     # Greedy rounding with local search improvement
     n = len(lp_solution)
     sol = list(lp_solution)
@@ -351,7 +355,7 @@ def _round_binary(lp_solution, int_set, c, A, b, minimize, eps):
 
     # Round fractional vars, preferring low-impact first
     candidates = [
-        (sign * c[j], lp_solution[j], j) for j in int_set if abs(lp_solution[j] - round(lp_solution[j])) > eps
+        (sign * c[j], lp_solution[j], j) for j in int_vars if abs(lp_solution[j] - round(lp_solution[j])) > eps
     ]
     candidates.sort()
 
@@ -375,7 +379,7 @@ def _round_binary(lp_solution, int_set, c, A, b, minimize, eps):
             if not feasible:
                 return None
 
-    if not _is_feasible(sol, A, b, int_set, eps):
+    if not _is_feasible(sol, A, b, int_vars, eps):
         return None
 
     # Phase 1: flip improvement
@@ -383,14 +387,14 @@ def _round_binary(lp_solution, int_set, c, A, b, minimize, eps):
     while improved:
         improved = False
         flip_candidates = [
-            (sign * c[j], j) for j in int_set if (minimize and sol[j] > 0.5) or (not minimize and sol[j] < 0.5)
+            (sign * c[j], j) for j in int_vars if (minimize and sol[j] > 0.5) or (not minimize and sol[j] < 0.5)
         ]
         flip_candidates.sort()
 
         for _, j in flip_candidates:
             old_val = sol[j]
             sol[j] = 1.0 - old_val
-            if _is_feasible(sol, A, b, int_set, eps):
+            if _is_feasible(sol, A, b, int_vars, eps):
                 improved = True
             else:
                 sol[j] = old_val
@@ -399,8 +403,8 @@ def _round_binary(lp_solution, int_set, c, A, b, minimize, eps):
     improved = True
     while improved:
         improved = False
-        zeros = [j for j in int_set if sol[j] < 0.5]
-        ones = [j for j in int_set if sol[j] > 0.5]
+        zeros = [j for j in int_vars if sol[j] < 0.5]
+        ones = [j for j in int_vars if sol[j] > 0.5]
 
         best_gain, best_swap = 0, None
         for j_on in zeros:
@@ -409,7 +413,7 @@ def _round_binary(lp_solution, int_set, c, A, b, minimize, eps):
                 net_gain = gain_on + sign * c[j_off]
                 if net_gain > best_gain:
                     sol[j_on], sol[j_off] = 1.0, 0.0
-                    if _is_feasible(sol, A, b, int_set, eps):
+                    if _is_feasible(sol, A, b, int_vars, eps):
                         best_gain, best_swap = net_gain, (j_on, j_off)
                     sol[j_on], sol[j_off] = 0.0, 1.0
 
@@ -421,21 +425,20 @@ def _round_binary(lp_solution, int_set, c, A, b, minimize, eps):
     return tuple(sol)
 
 
-def _lns_improve(solution, c, A, b, int_set, minimize, eps, max_iter, iterations, destroy_frac, rng):
+def _lns_improve(solution, c, A, b, int_vars, minimize, eps, max_iter, iterations, destroy_frac, rng):
     n = len(solution)
-    int_list = list(int_set)
-    k = max(1, int(len(int_list) * destroy_frac))
+    k = max(1, int(len(int_vars) * destroy_frac))
 
     def objective_fn(sol):
         return sum(c[j] * sol[j] for j in range(n))
 
     def destroy(sol, rng):
-        unfixed = set(rng.sample(int_list, min(k, len(int_list))))
+        unfixed = set(rng.sample(int_vars, min(k, len(int_vars))))
         return (sol, unfixed)
 
     def repair(partial, _):
         sol, unfixed = partial
-        candidate = _solve_sub_mip(sol, c, A, b, int_set, unfixed, minimize, eps, max_iter)
+        candidate = _solve_sub_mip(sol, c, A, b, int_vars, unfixed, minimize, eps, max_iter)
         return candidate if candidate else sol
 
     result = _lns(
@@ -451,13 +454,13 @@ def _lns_improve(solution, c, A, b, int_set, minimize, eps, max_iter, iterations
     return result.solution, result.evaluations
 
 
-def _solve_sub_mip(current_sol, c, A, b, int_set, free_vars, minimize, eps, max_iter):
+def _solve_sub_mip(current_sol, c, A, b, int_vars, free_vars, minimize, eps, max_iter):
     n = len(c)
     sign = 1 if minimize else -1
 
     lower = [0.0] * n
     upper = [float("inf")] * n
-    for j in int_set:
+    for j in int_vars:
         if j in free_vars:
             lower[j], upper[j] = 0.0, 1.0
         else:
@@ -478,7 +481,7 @@ def _solve_sub_mip(current_sol, c, A, b, int_set, free_vars, minimize, eps, max_
     rounded = list(sol)
     for j in free_vars:
         rounded[j] = round(rounded[j])
-    if _is_feasible(rounded, A, b, int_set, eps):
+    if _is_feasible(rounded, A, b, int_vars, eps):
         best_sol = tuple(rounded)
         best_obj = sum(c[j] * rounded[j] for j in range(n))
 
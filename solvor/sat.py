@@ -37,6 +37,7 @@ Don't use for: optimization (MILP), continuous variables (simplex/gradient).
 
 from collections.abc import Sequence
 from heapq import heapify, heappop, heappush
+from itertools import chain
 
 from solvor.types import Result, Status
 
@@ -115,11 +116,8 @@ def solve_sat(
     assumptions = list(assumptions) if assumptions else []
     clauses = [list(c) for c in clauses]
 
-    # Find all variables
-    n_vars = 0
-    for clause in clauses:
-        for lit in clause:
-            n_vars = max(n_vars, lit_var(lit))
+    # Find all variables, one C-level pass over every literal
+    n_vars = max(map(abs, chain.from_iterable(clauses)), default=0)
 
     if n_vars == 0:
         return Result({}, 0, 0, 0)
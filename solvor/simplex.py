@@ -74,114 +74,119 @@ def solve_lp(
     matrix.append(obj)
 
     basis = array("i", range(n, n + m))
-    basis_set = set(basis)
 
     if any(matrix[i][-1] < -eps for i in range(m)):
-        status, iters, matrix, basis, basis_set = _phase1(matrix, basis, basis_set, m, n, eps, max_iter)
+        status, iters, matrix, basis = _phase1(matrix, basis, m, n, eps, max_iter)
         if status != Status.OPTIMAL:
             return Result(tuple([0.0] * n), float("inf"), iters, iters, Status.INFEASIBLE)
         max_iter -= iters
     else:
         iters = 0
 
-    status, iters2, matrix, basis, basis_set = _phase2(matrix, basis, basis_set, m, eps, max_iter)
+    status, iters2, matrix, basis = _phase2(matrix, basis, m, eps, max_iter)
     return _extract(matrix, basis, m, n, status, iters + iters2, minimize)
 
 
-def _phase1(matrix, basis, basis_set, m, n, eps, max_iter):
+def _phase1(matrix, basis, m, n, eps, max_iter):
     n_total = n + m
-    art_cols = []
 
-    orig_obj = array("d", matrix[-1])
-
-    for i in range(m):
-        if matrix[i][-1] < -eps:
-            # Flip entire row including RHS (use current length, not cached)
-            row_len = len(matrix[i])
-            for j in range(row_len):
-                matrix[i][j] *= -1
-
-            art_col = n_total + len(art_cols)
+    # One artificial variable per row with negative RHS, counted up front so every
+    # row grows by all artificial columns at once instead of one insert per column
+    flipped = [i for i in range(m) if matrix[i][-1] < -eps]
+    if not flipped:
+        return Status.OPTIMAL, 0, matrix, basis
 
-            for row in matrix:
-                row.insert(-1, 0.0)
-
-            matrix[i][-2] = 1.0
-            basis_set.discard(basis[i])
-            basis[i] = art_col
-            basis_set.add(art_col)
-            art_cols.append(art_col)
+    n_art = len(flipped)
+    art_cols = list(range(n_total, n_total + n_art))
+    orig_obj = array("d", matrix[-1])
 
-    if not art_cols:
-        return Status.OPTIMAL, 0, matrix, basis, basis_set
+    for row in matrix:
+        rhs = row.pop()
+        row.extend([0.0] * n_art)
+        row.append(rhs)
 
-    n_cols = len(matrix[0])
-    matrix[-1] = array("d", [0.0] * n_cols)
+    for i, art_col in zip(flipped, art_cols):
+        # Flip entire row including RHS
+        row = matrix[i] = array("d", [-v for v in matrix[i]])
+        row[art_col] = 1.0
+        basis[i] = art_col
 
+    # Phase-1 objective is the sum of the artificials, priced out against their rows:
+    # minus the column sums of the flipped rows, plus 1 on each artificial column
+    obj = matrix[-1] = array("d", [-sum(column) for column in zip(*(matrix[i] for i in flipped))])
     for col in art_cols:
-        matrix[-1][col] = 1.0
-
-    for i in range(m):
-        if basis[i] in art_cols:
-            for j in range(n_cols):
-                matrix[-1][j] -= matrix[i][j]
+        obj[col] += 1.0
 
-    status, iters, matrix, basis, basis_set = _phase2(matrix, basis, basis_set, m, eps, max_iter)
+    status, iters, matrix, basis = _phase2(matrix, basis, m, eps, max_iter)
 
     if matrix[-1][-1] < -eps:
-        return Status.INFEASIBLE, iters, matrix, basis, basis_set
+        return Status.INFEASIBLE, iters, matrix, basis
 
     # Pivot out any artificial variables still in basis before removing columns
     n_cols = len(matrix[0])
+    in_basis = bytearray(n_cols)
+    for var in basis:
+        in_basis[var] = 1
     for i in range(m):
         if basis[i] in art_cols:
             # Find a non-artificial column to pivot in
+            row = matrix[i]
             for j in range(n_cols - 1 - len(art_cols)):  # Original + slack vars only
-                if j not in basis_set and abs(matrix[i][j]) > eps:
+                if not in_basis[j] and abs(row[j]) > eps:
                     matrix = _pivot(matrix, m, i, j, eps)
-                    basis_set.discard(basis[i])
+                    in_basis[basis[i]] = 0
                     basis[i] = j
-                    basis_set.add(j)
+                    in_basis[j] = 1
                     break
 
-    # Remove artificial columns (one at a time to preserve RHS at [-1])
-    for _ in art_cols:
-        for row in matrix:
-            del row[-2]
+    # Remove artificial columns, they sit just before the RHS
+    for row in matrix:
+        del row[-1 - n_art : -1]
 
-    matrix[-1] = orig_obj
-    n_cols = len(matrix[0])
+    obj = matrix[-1] = orig_obj
+    n_cols = len(obj)
 
-    for i in range(m):
-        var = basis[i]
+    # Price the original objective out against the basic rows, with the rows bound
+    # to locals so the inner loop is plain array indexing
+    for var, row in zip(basis, matrix):
         if var < n_cols - 1:
-            cost = matrix[-1][var]
+            cost = obj[var]
             if abs(cost) > eps:
                 for j in range(n_cols):
-                    matrix[-1][j] -= cost * matrix[i][j]
+                    obj[j] -= cost * row[j]
 
-    return Status.OPTIMAL, iters, matrix, basis, basis_set
+    return Status.OPTIMAL, iters, matrix, basis
 
 
-def _phase2(matrix, basis, basis_set, m, eps, max_iter):
+def _phase2(matrix, basis, m, eps, max_iter):
     n_cols = len(matrix[0])
 
+    # Basis membership as a byte per column, indexed instead of hashed
+    in_basis = bytearray(n_cols)
+    for var in basis:
+        in_basis[var] = 1
+
     for iteration in range(max_iter):
-        # Bland's rule for entering: smallest index with negative reduced cost
+        # Bland's rule for entering: smallest index with negative reduced cost. Basic
+        # columns have zero reduced cost, so the float test goes first and the basis
+        # lookup only runs for the rare candidates.
         enter = -1
+        cost = matrix[-1]
         for j in range(n_cols - 1):
-            if j not in basis_set and matrix[-1][j] < -eps:
+            if cost[j] < -eps and not in_basis[j]:
                 enter = j
                 break
 
         if enter == -1:
-            return Status.OPTIMAL, iteration, matrix, basis, basis_set
+            return Status.OPTIMAL, iteration, matrix, basis
 
         # Bland's rule for leaving: minimum ratio, ties broken by smallest basis index
         leave, min_ratio = -1, float("inf")
         for i in range(m):
-            if matrix[i][enter] > eps:
-                ratio = matrix[i][-1] / matrix[i][enter]
+            row = matrix[i]
+            a = row[enter]
+            if a > eps:
+                ratio = row[-1] / a
                 if ratio < min_ratio - eps:
                     min_ratio, leave = ratio, i
                 elif abs(ratio - min_ratio) <= eps:
@@ -189,33 +194,36 @@ def _phase2(matrix, basis, basis_set, m, eps, max_iter):
                         leave = i
 
         if leave == -1:
-            return Status.UNBOUNDED, iteration, matrix, basis, basis_set
+            return Status.UNBOUNDED, iteration, matrix, basis
 
         matrix = _pivot(matrix, m, leave, enter, eps)
-        basis_set.discard(basis[leave])
+        in_basis[basis[leave]] = 0
         basis[leave] = enter
-        basis_set.add(enter)
+        in_basis[enter] = 1
 
-    return Status.MAX_ITER, max_iter, matrix, basis, basis_set
+    return Status.MAX_ITER, max_iter, matrix, basis
 
 
 def _pivot(matrix, m, row, col, eps):
-    n_cols = len(matrix[0])
     pivot_val = matrix[row][col]
     if abs(pivot_val) < eps:
         # Numerical instability, skip pivot
         return matrix
     inv = 1.0 / pivot_val
 
-    for j in range(n_cols):
-        matrix[row][j] *= inv
+    pivot_row = matrix[row] = array("d", [v * inv for v in matrix[row]])
+
+    # Tableaux are mostly zeros, so elimination only touches the pivot row's nonzero
+    # columns (v - f * 0.0 == v, skipping them changes nothing)
+    nonzero = [(j, p) for j, p in enumerate(pivot_row) if p != 0.0]
 
     for i in range(m + 1):
         if i != row:
-            f = matrix[i][col]
+            row_i = matrix[i]
+            f = row_i[col]
             if abs(f) > eps:
-                for j in range(n_cols):
-                    matrix[i][j] -= f * matrix[row][j]
+                for j, p in nonzero:
+                    row_i[j] -= f * p
 
     return matrix
 
@@ -34,6 +34,8 @@ Parameters:
     initial: starting solution
     objective_fn: function mapping solution to score
     neighbors: returns list of (move, new_solution) pairs
+    delta_fn: optional delta_fn(solution, move) giving the objective change of a
+        move, so candidates are scored without calling objective_fn
     cooldown: how long moves stay tabu (default: 10)
     max_no_improve: stop after this many iterations without improvement
     seed: random seed for tie-breaking when multiple neighbors have equal cost
@@ -44,7 +46,7 @@ probabilistic (simpler setup), tabu is greedy with memory (more predictable).
 
 from collections import deque
 from collections.abc import Callable, Sequence
-from itertools import pairwise
+from itertools import accumulate, pairwise
 from random import Random
 
 from solvor.types import ProgressCallback, Result, Status
@@ -62,36 +64,70 @@ def tabu_search[T, M](
     cooldown: int = 10,
     max_iter: int = 1000,
     max_no_improve: int = 100,
+    delta_fn: Callable[[T, M], float] | None = None,
     seed: int | None = None,
     on_progress: ProgressCallback | None = None,
     progress_interval: int = 0,
 ) -> Result:
-    rng = Random(seed)
     evaluate = Evaluator(objective_fn, minimize)
 
-    solution, obj = initial, evaluate(initial)
+    def scored(solution, obj):
+        if delta_fn is None:
+            return [(move, evaluate(neighbor), neighbor) for move, neighbor in neighbors(solution)]
+        candidates = [
+            (move, obj + evaluate.sign * delta_fn(solution, move), neighbor) for move, neighbor in neighbors(solution)
+        ]
+        evaluate.evals += len(candidates)
+        return candidates
+
+    def accept(move, neighbor, neighbor_obj):
+        if delta_fn is None:
+            return neighbor, neighbor_obj
+        # Score the accepted neighbor in full so rounding in the deltas never accumulates
+        return neighbor, evaluate(neighbor)
+
+    return _search(
+        initial,
+        evaluate(initial),
+        scored,
+        accept,
+        evaluate,
+        Random(seed),
+        cooldown,
+        max_iter,
+        max_no_improve,
+        on_progress,
+        progress_interval,
+    )
+
+
+def _search(
+    solution, obj, scored, accept, evaluate, rng, cooldown, max_iter, max_no_improve, on_progress, progress_interval
+):
+    # The loop shared by tabu_search and the 2-opt TSP search. scored(solution, obj) lists
+    # (move, neighbor_obj, neighbor) in internal units, accept(move, neighbor, neighbor_obj)
+    # turns the chosen candidate into the next (solution, obj).
     best_solution, best_obj, best_iter = solution, obj, 0
     tabu_list, tabu_set = deque(maxlen=cooldown), set()
 
     for iteration in range(1, max_iter + 1):
-        candidates = list(neighbors(solution))
-        if not candidates:
-            break
-
+        candidates = scored(solution, obj)
         rng.shuffle(candidates)
-        best_move, best_neighbor, best_neighbor_obj = None, None, float("inf")
+        best = None
+        best_neighbor_obj = float("inf")
 
-        for move, neighbor in candidates:
-            neighbor_obj = evaluate(neighbor)
+        for candidate in candidates:
+            move, neighbor_obj, _ = candidate
             if move in tabu_set and neighbor_obj >= best_obj:
                 continue
             if neighbor_obj < best_neighbor_obj:
-                best_neighbor_obj, best_neighbor, best_move = neighbor_obj, neighbor, move
+                best_neighbor_obj, best = neighbor_obj, candidate
 
-        if best_neighbor is None:
+        if best is None:
             break
 
-        solution, obj = best_neighbor, best_neighbor_obj
+        best_move = best[0]
+        solution, obj = accept(best_move, best[2], best_neighbor_obj)
 
         if len(tabu_list) == cooldown:
             tabu_set.discard(tabu_list[0])
@@ -127,23 +163,7 @@ def solve_tsp(
 
     if n < 4:
         tour = list(range(n))
-        obj = sum(matrix[a][b] for a, b in pairwise(tour + [tour[0]]))
-        return Result(tour, obj, 0, 1, Status.FEASIBLE)
-
-    def objective_fn(tour):
-        return sum(matrix[a][b] for a, b in pairwise(tour + [tour[0]]))
-
-    def neighbors(tour):
-        moves = []
-
-        for i in range(n - 1):
-            for j in range(i + 2, n):
-                if i == 0 and j == n - 1:
-                    continue
-                new_tour = tour[: i + 1] + tour[i + 1 : j + 1][::-1] + tour[j + 1 :]
-                moves.append(((i, j), new_tour))
-
-        return moves
+        return Result(tour, _tour_length(matrix, tour), 0, 1, Status.FEASIBLE)
 
     tour, remaining = [0], set(range(1, n))
 
@@ -152,13 +172,72 @@ def solve_tsp(
         tour.append(nearest)
         remaining.remove(nearest)
 
-    return tabu_search(
+    return _two_opt_search(
+        matrix,
         tour,
-        objective_fn,
-        neighbors,
         minimize=minimize,
         seed=seed,
         on_progress=on_progress,
         progress_interval=progress_interval,
         **kwargs,
     )
+
+
+def _tour_length(matrix, tour):
+    return sum(matrix[a][b] for a, b in pairwise(tour + [tour[0]]))
+
+
+def _two_opt_search(
+    matrix,
+    tour,
+    *,
+    minimize,
+    seed,
+    on_progress,
+    progress_interval,
+    cooldown=10,
+    max_iter=1000,
+    max_no_improve=100,
+):
+    # A move reversing tour[i + 1 : j + 1] is scored from the current length in O(1)
+    # instead of building and summing the whole new tour
+    n = len(tour)
+    evaluate = Evaluator(lambda t: _tour_length(matrix, t), minimize)
+    sign = evaluate.sign
+    moves = [(i, j) for i in range(n - 1) for j in range(i + 2, n) if not (i == 0 and j == n - 1)]
+
+    def scored(tour, obj):
+        # Prefix sums of edge costs along the tour, walked forwards and backwards, so
+        # reversing a segment of an asymmetric matrix is priced in O(1) too
+        fwd = list(accumulate((matrix[a][b] for a, b in pairwise(tour)), initial=0))
+        bwd = list(accumulate((matrix[b][a] for a, b in pairwise(tour)), initial=0))
+
+        candidates = []
+        for i, j in moves:
+            a, b, c, d = tour[i], tour[i + 1], tour[j], tour[(j + 1) % n]
+            delta = matrix[a][c] + matrix[b][d] - matrix[a][b] - matrix[c][d]
+            delta += (bwd[j] - bwd[i + 1]) - (fwd[j] - fwd[i + 1])
+            candidates.append(((i, j), obj + sign * delta, tour))
+        evaluate.evals += len(candidates)
+        return candidates
+
+    def accept(move, tour, neighbor_obj):
+        # Only the accepted move is turned into a tour, then re-summed so rounding
+        # in the deltas never accumulates
+        i, j = move
+        tour = tour[: i + 1] + tour[i + 1 : j + 1][::-1] + tour[j + 1 :]
+        return tour, sign * _tour_length(matrix, tour)
+
+    return _search(
+        tour,
+        evaluate(tour),
+        scored,
+        accept,
+        evaluate,
+        Random(seed),
+        cooldown,
+        max_iter,
+        max_no_improve,
+        on_progress,
+        progress_interval,
+    )
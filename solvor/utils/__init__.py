@@ -7,6 +7,7 @@ by solvers. Also available for custom implementations.
     from solvor.utils import UnionFind, FenwickTree
     from solvor.utils import check_matrix_dims, check_positive
     from solvor.utils import Evaluator, report_progress
+    from solvor.utils import multistart
 """
 
 from solvor.utils.data_structures import FenwickTree, UnionFind
@@ -22,6 +23,7 @@ from solvor.utils.helpers import (
     report_progress,
     timed_progress,
 )
+from solvor.utils.parallel import multistart
 from solvor.utils.validate import (
     check_bounds,
     check_edge_nodes,
@@ -48,6 +50,7 @@ __all__ = [
     "timed_progress",
     "default_progress",
     "report_progress",
+    "multistart",
     "check_matrix_dims",
     "check_sequence_lengths",
     "check_bounds",
@@ -35,33 +35,45 @@ class FenwickTree:
             self._n = values
             self._tree = [0.0] * values
         else:
-            self._n = len(values)
-            self._tree = list(values)
-            for i in range(self._n):
+            n = len(values)
+            tree = list(values)
+            for i in range(n):
                 j = i | (i + 1)
-                if j < self._n:
-                    self._tree[j] += self._tree[i]
+                if j < n:
+                    tree[j] += tree[i]
+            self._n = n
+            self._tree = tree
 
     def update(self, i: int, delta: float) -> None:
         """Add delta to element at index i."""
-        while i < self._n:
-            self._tree[i] += delta
+        tree, n = self._tree, self._n
+        while i < n:
+            tree[i] += delta
             i |= i + 1
 
     def prefix(self, i: int) -> float:
         """Return sum of elements from index 0 to i (inclusive)."""
+        tree = self._tree
         total = 0.0
         while i >= 0:
-            total += self._tree[i]
+            total += tree[i]
             i = (i & (i + 1)) - 1
         return total
 
     def range_sum(self, left: int, right: int) -> float:
         """Return sum of elements from left to right (inclusive)."""
-        result = self.prefix(right)
-        if left > 0:
-            result -= self.prefix(left - 1)
-        return result
+        # Walk both prefix chains together, they share a tail once they meet
+        tree = self._tree
+        total = 0.0
+        i, j = right, left - 1
+        while i != j:
+            if i > j:
+                total += tree[i]
+                i = (i & (i + 1)) - 1
+            else:
+                total -= tree[j]
+                j = (j & (j + 1)) - 1
+        return total
 
     def __len__(self) -> int:
         """Return number of elements."""
@@ -0,0 +1,55 @@
+"""
+Multi-start helper for stochastic and local solvers.
+
+Runs the same solver several times with different per-run arguments (seeds,
+starting points) and keeps the best result. Runs are independent, so they can
+be spread over worker processes.
+
+    from solvor.utils import multistart
+
+    # Five annealing chains with different seeds
+    result = multistart(anneal, initial, objective_fn, neighbors, runs=[{"seed": s} for s in range(5)])
+
+    # Adam from several starting points, four worker processes
+    result = multistart(adam, grad_fn, runs=[{"x0": x} for x in starts], n_workers=4)
+"""
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from typing import Any
+
+from solvor.types import Result, Status
+
+__all__ = ["multistart"]
+
+
+def multistart(
+    solver: Callable[..., Result],
+    *args: Any,
+    runs: Sequence[dict[str, Any]],
+    minimize: bool = True,
+    n_workers: int | None = None,
+    **kwargs: Any,
+) -> Result:
+    """Run solver once per entry in runs and return the best result.
+
+    Each run calls solver(*args, **kwargs, **run). Evaluations are summed over
+    all runs. With n_workers > 1 runs go to a process pool, so solver and its
+    arguments must be picklable (module-level functions, no lambdas).
+    """
+    if not runs:
+        raise ValueError("runs must contain at least one entry")
+
+    calls = [{**kwargs, **run, "minimize": minimize} for run in runs]
+    if n_workers is not None and n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [executor.submit(solver, *args, **call) for call in calls]
+            results = [f.result() for f in futures]
+    else:
+        results = [solver(*args, **call) for call in calls]
+
+    usable = [r for r in results if r.status not in (Status.INFEASIBLE, Status.UNBOUNDED)] or results
+    pick = min if minimize else max
+    best = pick(usable, key=lambda r: r.objective)
+    return replace(best, evaluations=sum(r.evaluations for r in results))
@@ -141,16 +141,18 @@ def simplex_phase(
             return
 
         # Pivot
-        piv = tab[leave][enter]
+        pivot_row = tab[leave]
+        piv = pivot_row[enter]
         for j in range(n_cols):
-            tab[leave][j] /= piv
+            pivot_row[j] /= piv
 
         for i in range(n_rows + 1):
             if i != leave:
-                factor = tab[i][enter]
+                row = tab[i]
+                factor = row[enter]
                 if abs(factor) > eps:
                     for j in range(n_cols):
-                        tab[i][j] -= factor * tab[leave][j]
+                        row[j] -= factor * pivot_row[j]
 
         basis_set.discard(basis[leave])
         basis[leave] = enter
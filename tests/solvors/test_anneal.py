@@ -1,13 +1,36 @@
 """Tests for the simulated annealing solver."""
 
-from random import gauss, seed
+from math import cos, sumprod
+from random import Random
 
-from solvor.anneal import anneal
+import pytest
+
+from solvor.anneal import anneal, lundy_mees_cooling, reciprocal_cooling
 from solvor.types import Progress, Status
 
+# Neighbor functions draw from this instead of the global random state, reseeded per test
+rng = Random(42)
+
+
+@pytest.fixture(autouse=True)
+def seeded():
+    """Every test starts from the same random state."""
+    rng.seed(42)
+
+
+def sum_sq(x):
+    """Sum of squares, minimum 0 at the origin."""
+    return sumprod(x, x)
+
+
+def neg_sum_sq(x):
+    """Negated sum of squares, maximum 0 at the origin."""
+    return -sumprod(x, x)
+
 
 def make_neighbor_fn(std=0.5):
     """Create a neighbor function with gaussian perturbation."""
+    gauss = rng.gauss
 
     def neighbor(x):
         return [xi + gauss(0, std) for xi in x]
@@ -16,36 +39,29 @@ def make_neighbor_fn(std=0.5):
 
 
 class TestBasicAnneal:
-    def test_minimize_quadratic(self):
-        # Minimize x^2, starting from x=5
-        seed(42)
-        result = anneal([5.0], lambda x: x[0] ** 2, make_neighbor_fn(0.5), max_iter=5000)
-        assert result.status in (Status.FEASIBLE, Status.MAX_ITER)
-        assert abs(result.solution[0]) < 1.0
-
-    def test_maximize_quadratic(self):
-        # Maximize -x^2 (peak at 0)
-        seed(42)
-        result = anneal([5.0], lambda x: -(x[0] ** 2), make_neighbor_fn(0.5), minimize=False, max_iter=5000)
-        assert abs(result.solution[0]) < 1.0
-
-    def test_2d_optimization(self):
-        # Minimize x^2 + y^2
-        seed(42)
-        result = anneal([3.0, 4.0], lambda x: x[0] ** 2 + x[1] ** 2, make_neighbor_fn(0.3), max_iter=10000)
+    # Minimize x^2 from x=5, maximize -x^2 (peak at 0), minimize x^2 + y^2 from (3, 4)
+    @pytest.mark.parametrize(
+        ("x0", "objective", "minimize", "std", "max_iter", "tol"),
+        [
+            ([5.0], sum_sq, True, 0.5, 5000, 1.0),
+            ([5.0], neg_sum_sq, False, 0.5, 5000, 1.0),
+            ([3.0, 4.0], sum_sq, True, 0.3, 10000, 1.5),
+        ],
+        ids=["minimize", "maximize", "2d"],
+    )
+    def test_quadratic(self, x0, objective, minimize, std, max_iter, tol):
+        result = anneal(x0, objective, make_neighbor_fn(std), minimize=minimize, max_iter=max_iter)
         assert result.status in (Status.FEASIBLE, Status.MAX_ITER)
-        assert abs(result.solution[0]) < 1.5
-        assert abs(result.solution[1]) < 1.5
+        assert all(abs(v) < tol for v in result.solution)
 
 
 class TestMultiModal:
     def test_rastrigin_like(self):
         # Simple multimodal function: x^2 + sin(4*x)
         # Has local minima but global at x~0
-        seed(42)
         result = anneal(
             [3.0],
-            lambda x: x[0] ** 2 + 0.5 * (1 - __import__("math").cos(4 * x[0])),
+            lambda x: x[0] ** 2 + 0.5 * (1 - cos(4 * x[0])),
             make_neighbor_fn(0.3),
             max_iter=5000,
             temperature=100.0,
@@ -57,25 +73,109 @@ class TestMultiModal:
 class TestParameters:
     def test_min_temp_stop(self):
         # Should stop when temperature drops below min_temp
-        seed(42)
-        result = anneal([5.0], lambda x: x[0] ** 2, make_neighbor_fn(0.5), min_temp=1e-4, cooling=0.99, max_iter=100000)
+        result = anneal([5.0], sum_sq, make_neighbor_fn(0.5), min_temp=1e-4, cooling=0.99, max_iter=100000)
         assert result.status == Status.FEASIBLE
         # Must have stopped early due to min_temp, not max_iter
         assert result.iterations < 100000
 
 
+class TestCoolingSchedules:
+    def test_lundy_mees_matches_recurrence(self):
+        schedule = lundy_mees_cooling(beta=0.01)
+        temp = 100.0
+        for k in range(1, 50):
+            temp = temp / (1 + 0.01 * temp)
+            assert abs(schedule(100.0, k, 50) - temp) < 1e-9
+
+    def test_reciprocal_values(self):
+        schedule = reciprocal_cooling(alpha=0.5)
+        assert schedule(10.0, 0, 100) == 10.0
+        assert schedule(10.0, 2, 100) == 10.0 / 3
+
+    def test_anneal_with_new_schedules(self):
+        for schedule in (lundy_mees_cooling(1e-3), reciprocal_cooling(1e-4)):
+            result = anneal([5.0], sum_sq, make_neighbor_fn(0.5), cooling=schedule, max_iter=5000)
+            assert abs(result.solution[0]) < 1.0
+
+
+class TestPatience:
+    def test_stops_on_stagnation(self):
+        # Constant objective never improves, so patience kicks in right away
+        result = anneal([0.0], lambda x: 1.0, make_neighbor_fn(0.5), patience=50, max_iter=10000)
+        assert result.iterations == 50
+        assert result.status == Status.FEASIBLE
+
+    def test_disabled_by_default(self):
+        result = anneal([0.0], lambda x: 1.0, make_neighbor_fn(0.5), max_iter=500)
+        assert result.iterations == 500
+        assert result.status == Status.MAX_ITER
+
+    def test_still_converges(self):
+        result = anneal([5.0], sum_sq, make_neighbor_fn(0.5), patience=2000, max_iter=50000)
+        assert abs(result.solution[0]) < 1.0
+
+
+class TestLandscapeModified:
+    def test_minimize(self):
+        result = anneal(
+            [5.0],
+            sum_sq,
+            make_neighbor_fn(0.5),
+            cooling=reciprocal_cooling(1e-4),
+            landscape_modified=True,
+            max_iter=5000,
+        )
+        assert abs(result.solution[0]) < 1.0
+
+    def test_maximize(self):
+        result = anneal(
+            [5.0], neg_sum_sq, make_neighbor_fn(0.5), minimize=False, landscape_modified=True, max_iter=5000
+        )
+        assert abs(result.solution[0]) < 1.0
+
+
+class TestBatch:
+    def test_batch_counts_evaluations(self):
+        result = anneal([5.0], sum_sq, make_neighbor_fn(0.5), max_iter=300, batch=4)
+        assert result.iterations == 300
+        assert result.evaluations == 1 + 300 * 4
+        assert abs(result.solution[0]) < 1.0
+
+    def test_batch_picks_best_candidate(self):
+        # Improving moves are always accepted, so the best of the three becomes the solution
+        candidates = iter([[3.0], [1.0], [2.0]])
+        result = anneal([5.0], sum_sq, lambda x: next(candidates), max_iter=1, batch=3)
+        assert result.solution == [1.0]
+
+    def test_batch_maximize(self):
+        result = anneal([5.0], neg_sum_sq, make_neighbor_fn(0.5), minimize=False, max_iter=500, batch=3)
+        assert abs(result.solution[0]) < 1.0
+
+    def test_invalid_batch(self):
+        with pytest.raises(ValueError):
+            anneal([5.0], sum_sq, make_neighbor_fn(0.5), batch=0)
+
+
+class TestMultiStart:
+    def test_restarts_return_best(self):
+        result = anneal([5.0], sum_sq, make_neighbor_fn(0.5), max_iter=500, n_restarts=4, seed=1)
+        assert result.evaluations == 4 * 501
+        assert abs(result.solution[0]) < 1.0
+
+    def test_restarts_maximize(self):
+        result = anneal([5.0], neg_sum_sq, make_neighbor_fn(0.5), minimize=False, max_iter=500, n_restarts=3)
+        assert result.objective <= 0
+        assert abs(result.solution[0]) < 1.0
+
+
 class TestAnnealingBehavior:
     def test_low_temp_rejects_worse_solutions(self):
         # At low temperature, should rarely accept worse moves
-        seed(42)
-
-        def objective(x):
-            return x[0] ** 2
 
         # Track how much the solution drifts from optimal at low temp
         result = anneal(
             [0.0],  # Start at optimal
-            objective,
+            sum_sq,
             make_neighbor_fn(1.0),  # Large perturbations
             temperature=0.001,  # Very low temp
             cooling=0.999,
@@ -86,24 +186,23 @@ class TestAnnealingBehavior:
 
     def test_temperature_affects_exploration(self):
         # Higher temperature should explore more (larger variance in solutions)
-        seed(42)
         high_temp_solutions = []
         low_temp_solutions = []
 
         def collect_high(x):
             high_temp_solutions.append(x[0])
-            return [x[0] + gauss(0, 0.5)]
+            return [x[0] + rng.gauss(0, 0.5)]
 
         def collect_low(x):
             low_temp_solutions.append(x[0])
-            return [x[0] + gauss(0, 0.5)]
+            return [x[0] + rng.gauss(0, 0.5)]
 
         # High temperature run
-        anneal([0.0], lambda x: x[0] ** 2, collect_high, temperature=1000.0, max_iter=200)
+        anneal([0.0], sum_sq, collect_high, temperature=1000.0, max_iter=200)
 
         # Low temperature run
-        seed(42)  # Same seed for fair comparison
-        anneal([0.0], lambda x: x[0] ** 2, collect_low, temperature=0.01, max_iter=200)
+        rng.seed(42)  # Same seed for fair comparison
+        anneal([0.0], sum_sq, collect_low, temperature=0.01, max_iter=200)
 
         # High temp should have more variance (explored more)
         high_var = sum(
@@ -119,54 +218,45 @@ class TestAnnealingBehavior:
 class TestEdgeCases:
     def test_already_optimal(self):
         # Start at optimal
-        seed(42)
-        result = anneal([0.0], lambda x: x[0] ** 2, make_neighbor_fn(0.1), max_iter=1000)
+        result = anneal([0.0], sum_sq, make_neighbor_fn(0.1), max_iter=1000)
         # Should stay near optimal
         assert abs(result.solution[0]) < 0.5
 
     def test_discrete_neighbor(self):
         # Discrete optimization
-        seed(42)
 
         def discrete_objective(x):
             return abs(x[0] - 7)
 
         def discrete_neighbor(x):
-            from random import choice
-
-            delta = choice([-1, 1])
-            return [x[0] + delta]
+            return [x[0] + (1 if rng.getrandbits(1) else -1)]
 
         result = anneal([0], discrete_objective, discrete_neighbor, max_iter=1000)
         assert abs(result.solution[0] - 7) < 3
 
     def test_high_dimensional(self):
         # Higher dimensional problem
-        seed(42)
-        n = 10
-        result = anneal([5.0] * n, lambda x: sum(xi**2 for xi in x), make_neighbor_fn(0.2), max_iter=20000)
+        x0 = [5.0] * 10
+        result = anneal(x0, sum_sq, make_neighbor_fn(0.2), max_iter=20000)
         # Should reduce the objective significantly
-        assert result.objective < sum(5.0**2 for _ in range(n)) * 0.5
+        assert result.objective < sum_sq(x0) * 0.5
 
 
 class TestStress:
     def test_many_iterations(self):
         # Long run for better convergence
-        seed(42)
-        result = anneal([10.0], lambda x: x[0] ** 2, make_neighbor_fn(0.3), max_iter=50000)
+        result = anneal([10.0], sum_sq, make_neighbor_fn(0.3), max_iter=50000)
         assert abs(result.solution[0]) < 0.5
 
     def test_evaluations_counted(self):
         # Verify evaluations are tracked
-        seed(42)
-        result = anneal([5.0], lambda x: x[0] ** 2, make_neighbor_fn(0.5), max_iter=100)
+        result = anneal([5.0], sum_sq, make_neighbor_fn(0.5), max_iter=100)
         # Should have at least initial + max_iter evaluations
         assert result.evaluations >= 100
 
 
 class TestProgressCallback:
     def test_callback_called_at_interval(self):
-        seed(42)
         calls = []
 
         def on_progress(p: Progress):
@@ -174,7 +264,7 @@ class TestProgressCallback:
 
         anneal(
             [5.0],
-            lambda x: x[0] ** 2,
+            sum_sq,
             make_neighbor_fn(0.5),
             max_iter=100,
             on_progress=on_progress,
@@ -185,7 +275,6 @@ class TestProgressCallback:
         assert all(i % 10 == 0 for i in calls)
 
     def test_callback_early_stop(self):
-        seed(42)
         calls = []
 
         def on_progress(p: Progress):
@@ -195,7 +284,7 @@ class TestProgressCallback:
 
         result = anneal(
             [5.0],
-            lambda x: x[0] ** 2,
+            sum_sq,
             make_neighbor_fn(0.5),
             max_iter=1000,
             on_progress=on_progress,
@@ -206,7 +295,6 @@ class TestProgressCallback:
         assert result.status == Status.FEASIBLE
 
     def test_callback_disabled_by_default(self):
-        seed(42)
         calls = []
 
         def on_progress(p: Progress):
@@ -214,7 +302,7 @@ class TestProgressCallback:
 
         anneal(
             [5.0],
-            lambda x: x[0] ** 2,
+            sum_sq,
             make_neighbor_fn(0.5),
             max_iter=100,
             on_progress=on_progress,
@@ -223,7 +311,6 @@ class TestProgressCallback:
         assert len(calls) == 0
 
     def test_callback_receives_progress_data(self):
-        seed(42)
         progress_data = []
 
         def on_progress(p: Progress):
@@ -231,7 +318,7 @@ class TestProgressCallback:
 
         anneal(
             [5.0],
-            lambda x: x[0] ** 2,
+            sum_sq,
             make_neighbor_fn(0.5),
             max_iter=100,
             on_progress=on_progress,
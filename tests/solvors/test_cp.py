@@ -89,6 +89,23 @@ class TestArithmetic:
         total = result.solution["x"] + result.solution["y"] + result.solution["z"]
         assert total == 9
 
+    def test_sum_mixed_sign_domains(self):
+        domains = [(-1, 2), (0, 0), (1, 5), (-2, -1), (0, 0)]
+        m = Model()
+        xs = [m.int_var(lb, ub, f"x{i}") for i, (lb, ub) in enumerate(domains)]
+        m.add(m.sum_eq(xs, 2))
+        result = m.solve()
+        assert result.status == Status.OPTIMAL
+        assert sum(result.solution.values()) == 2
+
+    def test_sum_tight_target(self):
+        m = Model()
+        xs = [m.int_var(0, 4, f"x{i}") for i in range(4)]
+        m.add(m.sum_eq(xs, 16))
+        result = m.solve()
+        assert result.status == Status.OPTIMAL
+        assert all(v == 4 for v in result.solution.values())
+
     def test_inequality(self):
         m = Model()
         x = m.int_var(1, 10, "x")
@@ -479,6 +496,38 @@ class TestSolverSelection:
         assert result.ok
         assert result.solution["x"] != result.solution["y"]
 
+    def test_sat_wide_domains(self):
+        """SAT encoding of domains and all_different wider than the pairwise cutoff."""
+        m = Model()
+        xs = [m.int_var(0, 11, f"x{i}") for i in range(12)]
+        m.add(m.all_different(xs))
+        result = m.solve(solver="sat")
+        assert result.ok
+        assert sorted(result.solution.values()) == list(range(12))
+
+    def test_sat_wide_domains_distinct_solutions(self):
+        """Ladder aux vars never let the same assignment come back twice."""
+        m = Model()
+        x = m.int_var(0, 9, "x")
+        y = m.int_var(0, 9, "y")
+        m.add(m.all_different([x, y]))
+        result = m.solve(solver="sat", solution_limit=20)
+        keys = {(sol["x"], sol["y"]) for sol in result.solutions}
+        assert len(keys) == 20
+        assert all(a != b for a, b in keys)
+
+    def test_sat_all_different_far_apart_domains(self):
+        """Only values shared by two domains get at-most-one clauses, not the gap between them."""
+        m = Model()
+        x = m.int_var(0, 2, "x")
+        y = m.int_var(3_000_000, 3_000_002, "y")
+        z = m.int_var(0, 2, "z")
+        m.add(m.all_different([x, y, z]))
+        result = m.solve(solver="sat")
+        assert result.ok
+        assert result.solution["x"] != result.solution["z"]
+        assert 3_000_000 <= result.solution["y"] <= 3_000_002
+
     def test_invalid_solver_raises(self):
         """Unknown solver raises ValueError."""
         m = Model()
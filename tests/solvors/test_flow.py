@@ -1,5 +1,7 @@
 """Tests for the network flow solvers."""
 
+import pytest
+
 from solvor.flow import max_flow, min_cost_flow, solve_assignment
 from solvor.types import Status
 
@@ -82,14 +84,21 @@ class TestMinCostFlow:
         result = min_cost_flow(graph, "s", "t", 10)
         assert result.status == Status.INFEASIBLE
 
+    def test_source_is_sink(self):
+        # Demand is met without moving anything, the path to the sink is empty
+        graph = {"a": [("b", 5, 1)], "b": [("c", 5, 1)]}
+        result = min_cost_flow(graph, "a", "a", 3)
+        assert result.status == Status.OPTIMAL
+        assert result.objective == 0
+        assert result.solution == {}
+
 
 class TestAssignment:
     def test_simple_3x3(self):
         costs = [[10, 5, 13], [3, 9, 18], [10, 6, 12]]
         result = solve_assignment(costs)
         assert result.status == Status.OPTIMAL
-        assert len(result.solution) == 3
-        assert set(result.solution) == {0, 1, 2}
+        assert sorted(result.solution) == [0, 1, 2]
 
     def test_2x2(self):
         costs = [[1, 10], [10, 1]]
@@ -104,15 +113,32 @@ class TestAssignment:
         costs = [[5, 5, 5], [5, 5, 5], [5, 5, 5]]
         result = solve_assignment(costs)
         assert result.status == Status.OPTIMAL
-        assert len(set(result.solution)) == 3  # All different assignments
+        assert sorted(result.solution) == [0, 1, 2]  # All different assignments
         assert result.objective == 15  # 3 * 5
 
     def test_4x4(self):
         costs = [[9, 2, 7, 8], [6, 4, 3, 7], [5, 8, 1, 8], [7, 6, 9, 4]]
         result = solve_assignment(costs)
         assert result.status == Status.OPTIMAL
-        assert len(result.solution) == 4
-        assert set(result.solution) == {0, 1, 2, 3}
+        assert sorted(result.solution) == [0, 1, 2, 3]
+
+    def test_ssp_matches_hungarian(self):
+        costs = [[9, 2, 7, 8], [6, 4, 3, 7], [5, 8, 1, 8], [7, 6, 9, 4]]
+        hungarian = solve_assignment(costs)
+        ssp = solve_assignment(costs, method="ssp")
+        assert ssp.status == Status.OPTIMAL
+        assert ssp.objective == hungarian.objective == 13
+        assert sorted(ssp.solution) == [0, 1, 2, 3]
+
+    def test_ssp_rectangular(self):
+        costs = [[1, 5, 3, 2], [4, 2, 6, 1]]
+        result = solve_assignment(costs, method="ssp")
+        assert result.status == Status.OPTIMAL
+        assert result.objective == 2
+
+    def test_invalid_method(self):
+        with pytest.raises(ValueError, match="method"):
+            solve_assignment([[1]], method="simplex")
 
 
 class TestEdgeCases:
@@ -188,5 +214,4 @@ class TestStress:
         costs = [[random.randint(1, 20) for _ in range(n)] for _ in range(n)]
         result = solve_assignment(costs)
         assert result.status == Status.OPTIMAL
-        assert len(result.solution) == n
-        assert set(result.solution) == set(range(n))
+        assert sorted(result.solution) == list(range(n))
@@ -15,10 +15,8 @@ def simple_crossover(p1, p2):
 
 def bit_mutate(bits):
     """Flip a random bit."""
-    bits = list(bits)
     i = randint(0, len(bits) - 1)
-    bits[i] = 1 - bits[i]
-    return tuple(bits)
+    return bits[:i] + (1 - bits[i],) + bits[i + 1 :]
 
 
 class TestBasicGA:
@@ -112,6 +110,29 @@ class TestEdgeCases:
         assert result.status == Status.FEASIBLE
         assert result.objective < 4  # Mutation should find improvement
 
+    def test_repeated_solutions_evaluated_once(self):
+        calls = []
+
+        def objective(bits):
+            calls.append(bits)
+            return sum(bits)
+
+        population = [tuple([1, 0, 1, 0]) for _ in range(10)]
+        result = evolve(objective, population, simple_crossover, bit_mutate, max_iter=20, seed=42, cache=True)
+        assert len(calls) == len(set(calls))
+        assert result.evaluations == len(calls)
+
+    def test_evaluates_every_child_by_default(self):
+        calls = []
+
+        def objective(bits):
+            calls.append(bits)
+            return sum(bits)
+
+        population = [tuple([1, 0, 1, 0]) for _ in range(10)]
+        evolve(objective, population, simple_crossover, bit_mutate, max_iter=20, seed=42)
+        assert len(calls) == 10 + 20 * 8
+
 
 class TestStress:
     def test_long_chromosome(self):
@@ -124,11 +145,18 @@ class TestStress:
         assert result.objective < 25  # Should reduce significantly
 
     def test_many_generations(self):
+        # Genes packed into an int, bit i is gene i
         def objective(bits):
-            return sum(bits)
+            return bits.bit_count()
 
-        population = [tuple([1] * 10) for _ in range(20)]
-        result = evolve(objective, population, simple_crossover, bit_mutate, max_iter=200, seed=42)
+        def crossover(p1, p2):
+            return (p1 & 0b11111) | (p2 & ~0b11111)
+
+        def mutate(bits):
+            return bits ^ (1 << randint(0, 9))
+
+        population = [(1 << 10) - 1] * 20
+        result = evolve(objective, population, crossover, mutate, max_iter=200, seed=42)
         assert result.status == Status.FEASIBLE
         assert result.objective < 3
 
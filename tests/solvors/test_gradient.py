@@ -137,6 +137,19 @@ class TestConvergence:
         result = gradient_descent(grad, [100.0], lr=0.0001, max_iter=10, tol=1e-10)
         assert result.status == Status.MAX_ITER
 
+    def test_max_iter_no_extra_grad_call(self):
+        calls = []
+
+        def grad(x):
+            calls.append(x)
+            return [2 * x[0]]
+
+        for solver in (gradient_descent, momentum, rmsprop, adam):
+            calls.clear()
+            result = solver(grad, [100.0], lr=0.0001, max_iter=10, tol=1e-10)
+            assert len(calls) == 10
+            assert result.evaluations == 10
+
 
 class TestHigherDimensional:
     def test_5d(self):
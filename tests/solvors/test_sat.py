@@ -4,6 +4,12 @@ from solvor.sat import solve_sat
 from solvor.types import Status
 
 
+def unsatisfied(solution, clauses):
+    """Clauses the assignment leaves false, unassigned variables count as False."""
+    true_lits = {lit for clause in clauses for lit in clause if (lit > 0) == solution.get(abs(lit), False)}
+    return [clause for clause in clauses if true_lits.isdisjoint(clause)]
+
+
 class TestBasicSAT:
     def test_simple_satisfiable(self):
         # (x1 OR x2) AND (NOT x1 OR x2)
@@ -57,13 +63,7 @@ class TestThreeSAT:
         result = solve_sat(clauses)
         assert result.status == Status.OPTIMAL
         # Verify solution satisfies all clauses
-        for clause in clauses:
-            satisfied = any(
-                (lit > 0 and result.solution.get(abs(lit), False))
-                or (lit < 0 and not result.solution.get(abs(lit), False))
-                for lit in clause
-            )
-            assert satisfied
+        assert unsatisfied(result.solution, clauses) == []
 
     def test_3sat_with_many_clauses(self):
         # Satisfiable 3-SAT instance
@@ -77,13 +77,7 @@ class TestThreeSAT:
         result = solve_sat(clauses)
         assert result.status == Status.OPTIMAL
         # Verify all clauses satisfied
-        for clause in clauses:
-            satisfied = any(
-                (lit > 0 and result.solution.get(abs(lit), False))
-                or (lit < 0 and not result.solution.get(abs(lit), False))
-                for lit in clause
-            )
-            assert satisfied
+        assert unsatisfied(result.solution, clauses) == []
 
 
 class TestImplicationChains:
@@ -241,13 +235,7 @@ class TestStress:
         result = solve_sat(clauses)
         # Random 3-SAT with clause/var ratio ~2 is usually satisfiable
         if result.status == Status.OPTIMAL:
-            for clause in clauses:
-                satisfied = any(
-                    (lit > 0 and result.solution.get(abs(lit), False))
-                    or (lit < 0 and not result.solution.get(abs(lit), False))
-                    for lit in clause
-                )
-                assert satisfied
+            assert unsatisfied(result.solution, clauses) == []
 
 
 class TestLiteralHelpers:
@@ -1,8 +1,19 @@
 """Tests for the tabu search solver."""
 
-from solvor.tabu import solve_tsp, tabu_search
+from random import Random
+
+from solvor.tabu import _tour_length, solve_tsp, tabu_search
 from solvor.types import Progress, Status
 
+# Distance matrices built once at import, as tuples so no test can modify them
+DIST_3 = ((0, 1, 2), (1, 0, 3), (2, 3, 0))
+DIST_4 = (
+    (0, 10, 15, 20),
+    (10, 0, 35, 25),
+    (15, 35, 0, 30),
+    (20, 25, 30, 0),
+)
+
 
 class TestBasicTabu:
     def test_simple_search(self):
@@ -51,26 +62,43 @@ class TestBasicTabu:
         # Should find global optimum
         assert result.objective <= 1
 
+    def test_delta_fn_matches_full_evaluation(self):
+        # Swap moves on a permutation, scored by the change in adjacent differences
+        def objective(perm):
+            return sum(abs(a - b) for a, b in zip(perm, perm[1:]))
+
+        def neighbors(perm):
+            moves = []
+            for i in range(len(perm)):
+                for j in range(i + 1, len(perm)):
+                    new = list(perm)
+                    new[i], new[j] = new[j], new[i]
+                    moves.append(((i, j), tuple(new)))
+            return moves
+
+        def delta(perm, move):
+            i, j = move
+            new = list(perm)
+            new[i], new[j] = new[j], new[i]
+            return objective(new) - objective(perm)
+
+        start = (3, 0, 5, 1, 4, 2)
+        plain = tabu_search(start, objective, neighbors, max_iter=30, seed=1)
+        fast = tabu_search(start, objective, neighbors, max_iter=30, seed=1, delta_fn=delta)
+        assert fast.solution == plain.solution
+        assert fast.objective == plain.objective == objective(fast.solution)
+
 
 class TestTSP:
     def test_trivial_3city(self):
-        dist = [[0, 1, 2], [1, 0, 3], [2, 3, 0]]
-        result = solve_tsp(dist)
+        result = solve_tsp(DIST_3)
         assert result.status == Status.FEASIBLE
-        assert len(result.solution) == 3
-        assert set(result.solution) == {0, 1, 2}
+        assert sorted(result.solution) == [0, 1, 2]
 
     def test_small_4city(self):
-        dist = [
-            [0, 10, 15, 20],
-            [10, 0, 35, 25],
-            [15, 35, 0, 30],
-            [20, 25, 30, 0],
-        ]
-        result = solve_tsp(dist)
+        result = solve_tsp(DIST_4)
         assert result.status == Status.FEASIBLE
-        assert len(result.solution) == 4
-        assert set(result.solution) == {0, 1, 2, 3}
+        assert sorted(result.solution) == [0, 1, 2, 3]
 
     def test_symmetric_square(self):
         # 4 cities at corners of a square
@@ -97,8 +125,26 @@ class TestTSP:
         ]
         result = solve_tsp(dist)
         assert result.status == Status.FEASIBLE
-        assert len(result.solution) == 5
-        assert set(result.solution) == {0, 1, 2, 3, 4}
+        assert sorted(result.solution) == [0, 1, 2, 3, 4]
+
+    def test_asymmetric_objective_matches_tour(self):
+        # Reversing a segment changes the cost of every edge inside it when the
+        # matrix is asymmetric, the reported objective must still be the tour length
+        dist = [[0 if i == j else (i * 7 + j * 3) % 11 + 1 for j in range(9)] for i in range(9)]
+        result = solve_tsp(dist, seed=3)
+        tour = result.solution
+        assert sorted(tour) == list(range(9))
+        assert result.objective == sum(dist[a][b] for a, b in zip(tour, tour[1:] + tour[:1]))
+
+    def test_float_objective_matches_tour(self):
+        # Float deltas differ from a full re-sum in the last bits, the reported
+        # objective must still be the exact length of the returned tour
+        rng = Random(7)
+        dist = [[0.0 if i == j else rng.uniform(0.1, 100.0) for j in range(25)] for i in range(25)]
+        for minimize in (True, False):
+            result = solve_tsp(dist, minimize=minimize, seed=1, max_iter=300, max_no_improve=300)
+            assert sorted(result.solution) == list(range(25))
+            assert result.objective == _tour_length(dist, result.solution)
 
 
 class TestEdgeCases:
@@ -177,8 +223,7 @@ class TestStress:
 
         result = solve_tsp(dist, max_iter=500)
         assert result.status == Status.FEASIBLE
-        assert len(result.solution) == n
-        assert set(result.solution) == set(range(n))
+        assert sorted(result.solution) == list(range(n))
 
     def test_rapid_convergence(self):
         # Problem that should converge quickly
@@ -258,9 +303,8 @@ class TestMaximize:
 
     def test_maximize_tsp(self):
         # For TSP, maximize means longest path
-        dist = [[0, 1, 2], [1, 0, 3], [2, 3, 0]]
-        result_min = solve_tsp(dist, minimize=True)
-        result_max = solve_tsp(dist, minimize=False)
+        result_min = solve_tsp(DIST_3, minimize=True)
+        result_max = solve_tsp(DIST_3, minimize=False)
         # Longest tour should have larger objective
         assert result_max.objective >= result_min.objective
 
@@ -1,15 +1,20 @@
 """Tests for shared types."""
 
+import pytest
+
 from solvor.types import Progress, Result, Status
 
 
 class TestStatus:
-    def test_status_values(self):
-        assert Status.OPTIMAL == 1
-        assert Status.FEASIBLE == 2
-        assert Status.INFEASIBLE == 3
-        assert Status.UNBOUNDED == 4
-        assert Status.MAX_ITER == 5
+    @pytest.mark.parametrize(
+        ("name", "value"),
+        [("OPTIMAL", 1), ("FEASIBLE", 2), ("INFEASIBLE", 3), ("UNBOUNDED", 4), ("MAX_ITER", 5)],
+    )
+    def test_status_values(self, name, value):
+        assert Status[name] == value
+
+    def test_no_other_statuses(self):
+        assert len(Status) == 5
 
 
 class TestResult:
@@ -39,6 +39,15 @@ class TestFenwickTree:
         assert ft.range_sum(2, 2) == 3
         assert ft.range_sum(0, 0) == 1
 
+    def test_range_sum_all_ranges(self):
+        values = [3, -1, 4, 1, -5, 9, 2, -6, 5, 3, 5, -8, 9, 7]
+        ft = FenwickTree(values)
+        ft.update(6, 4)
+        values[6] += 4
+        for left in range(len(values)):
+            for right in range(left, len(values)):
+                assert ft.range_sum(left, right) == sum(values[left : right + 1])
+
     def test_len(self):
         ft = FenwickTree([1, 2, 3])
         assert len(ft) == 3
@@ -0,0 +1,50 @@
+"""Tests for the multi-start helper."""
+
+import pytest
+
+import solvor.types
+from solvor.types import Result, Status
+from solvor.utils import multistart
+
+
+def _fake_solver(offset, *, minimize=True, shift=0.0, seed=None):
+    # Looked up at call time: test_types reloads solvor.types, and a pool worker can
+    # only pickle the class currently registered under that name
+    return solvor.types.Result(seed, offset + shift, 1, 10)
+
+
+def _failing_solver(*, minimize=True, status=Status.FEASIBLE, objective=0.0):
+    return Result(None, objective, 1, 1, status)
+
+
+class TestMultistart:
+    def test_picks_minimum(self):
+        result = multistart(_fake_solver, 1.0, runs=[{"shift": 3.0}, {"shift": -2.0}, {"shift": 5.0}])
+        assert result.objective == -1.0
+        assert result.evaluations == 30
+
+    def test_picks_maximum(self):
+        result = multistart(_fake_solver, 1.0, runs=[{"shift": 3.0}, {"shift": -2.0}], minimize=False)
+        assert result.objective == 4.0
+
+    def test_shared_kwargs_overridden_by_run(self):
+        result = multistart(_fake_solver, 0.0, runs=[{"seed": 7}], seed=1)
+        assert result.solution == 7
+
+    def test_skips_infeasible_runs(self):
+        runs = [{"status": Status.INFEASIBLE, "objective": -100.0}, {"objective": 5.0}]
+        result = multistart(_failing_solver, runs=runs)
+        assert result.objective == 5.0
+
+    def test_all_infeasible_still_returns(self):
+        result = multistart(_failing_solver, runs=[{"status": Status.INFEASIBLE}])
+        assert result.status == Status.INFEASIBLE
+
+    def test_empty_runs(self):
+        with pytest.raises(ValueError, match="runs"):
+            multistart(_fake_solver, 0.0, runs=[])
+
+    def test_process_pool(self):
+        result = multistart(_fake_solver, 2.0, runs=[{"shift": s} for s in (1.0, -1.0, 0.5)], n_workers=2)
+        assert result.objective == 1.0
+        assert result.evaluations == 30